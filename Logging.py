@@ -1,51 +1,276 @@
+import atexit
+import datetime
+import gzip
+import json
 import logging
-from logging.handlers import TimedRotatingFileHandler
+import os
+import queue
+import shutil
+import threading
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
+
+# 비동기 모드에서 큐가 가득 찼을 때의 처리 방식
+OVERFLOW_POLICIES = ("block", "drop", "drop_debug_first")
+
+# drop_debug_first: 큐의 마지막 이 비율만큼은 INFO 이상 레코드용으로 남겨둠 (DEBUG는 먼저 버림)
+DEBUG_HEADROOM = 0.1
+
+# log()에서 그대로 logger.log()로 넘기는 레벨
+_KNOWN_LEVELS = frozenset((logging.DEBUG, logging.INFO, logging.WARNING, logging.ERROR, logging.CRITICAL))
+
+# LogRecord 기본 속성 (이 외의 속성은 logger의 extra=로 넘어온 값으로 보고 JSON에 포함)
+_RECORD_ATTRIBUTES = frozenset(logging.LogRecord("", 0, "", 0, "", (), None).__dict__) | {"message", "asctime", "fields"}
+
+class JsonFormatter(logging.Formatter):
+    """ 레코드를 한 줄 JSON으로 변환하는 포매터 (context + log(**fields) + extra 속성을 필드로 포함) """
+    def __init__(self, context: dict = None):
+        super().__init__()
+        self.context = dict(context or {})
+
+    def format(self, record):
+        entry = {
+            "time": datetime.datetime.fromtimestamp(record.created, datetime.timezone.utc)
+                    .isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "module": record.module,
+            "message": record.getMessage(),
+        }
+        entry.update(self.context)
+        entry.update(getattr(record, "fields", None) or {})
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRIBUTES:
+                entry[key] = value
+
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc_info"] = record.exc_text
+        if record.stack_info:
+            entry["stack_info"] = self.formatStack(record.stack_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+class BufferedTimedRotatingFileHandler(TimedRotatingFileHandler):
+    """ 포매팅한 줄을 모았다가 buffer_size개 또는 flush_interval초마다 한 번에 쓰는 TimedRotatingFileHandler
+
+    compress=True면 롤오버된 파일을 백그라운드 스레드에서 gzip(.gz)으로 압축한다.
+    """
+    def __init__(self, filename, when="midnight", interval=1, backup_count=7, buffer_size=100,
+                 flush_interval=1.0, compress=False, encoding="utf-8"):
+        super().__init__(filename, when=when, interval=interval, backupCount=backup_count, encoding=encoding)
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._buffer = []
+        self._compressions = []
+
+        if compress:
+            self.namer = lambda name: name + ".gz"
+            self.rotator = self._rotate_compressed
+
+        # 로그가 뜸할 때도 flush_interval 안에 파일에 기록되도록 주기적으로 비움
+        self._stop = threading.Event()
+        self._flusher = None
+        if flush_interval and flush_interval > 0:
+            self._flusher = threading.Thread(target=self._run_flusher, name="LogBufferFlusher", daemon=True)
+            self._flusher.start()
+
+    def _run_flusher(self):
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def emit(self, record):
+        """ 포매팅한 줄을 버퍼에 추가 (Handler.handle이 self.lock을 잡은 상태로 호출) """
+        try:
+            if self.shouldRollover(record):
+                self._write_buffer()
+                self.doRollover()
+            self._buffer.append(self.format(record))
+            if len(self._buffer) >= self.buffer_size:
+                self._write_buffer()
+        except Exception:
+            self.handleError(record)
+
+    def _write_buffer(self):
+        if not self._buffer:
+            return
+        if self.stream is None:
+            self.stream = self._open()
+        self.stream.write("\n".join(self._buffer) + "\n")
+        self.stream.flush()
+        self._buffer.clear()
+
+    def flush(self):
+        self.acquire()
+        try:
+            self._write_buffer()
+        finally:
+            self.release()
+
+    def _rotate_compressed(self, source, dest):
+        """ 롤오버 파일은 이름만 바꿔두고 gzip 압축은 백그라운드 스레드에서 수행 """
+        pending = dest[:-len(".gz")]
+        os.rename(source, pending)
+        thread = threading.Thread(target=self._compress, args=(pending, dest), name="LogCompressor")
+        thread.start()
+        self._compressions = [t for t in self._compressions if t.is_alive()] + [thread]
+
+    def _compress(self, pending, dest):
+        try:
+            with open(pending, "rb") as src, gzip.open(dest + ".part", "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            os.replace(dest + ".part", dest)
+            os.remove(pending)
+        except OSError as e:
+            # 압축에 실패해도 압축 전 파일(pending)은 그대로 남음
+            print(f"❌ Log compression failed for {pending}: {e}")
+
+    def close(self):
+        """ 남은 버퍼를 쓰고 주기적 flush / 진행 중인 압축을 마친 뒤 파일을 닫음 """
+        self._stop.set()
+        if self._flusher is not None and self._flusher is not threading.current_thread():
+            self._flusher.join()
+        self.flush()
+        for thread in self._compressions:
+            thread.join()
+        super().close()
+
+class BoundedQueueHandler(QueueHandler):
+    """ 크기가 제한된 큐에 레코드를 넣는 QueueHandler (가득 찼을 때 overflow 정책 적용) """
+    def __init__(self, log_queue: queue.Queue, overflow: str = "block"):
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow!r} (use one of {', '.join(OVERFLOW_POLICIES)})")
+        super().__init__(log_queue)
+        self.overflow = overflow
+        self.dropped = 0  # 큐가 가득 차서 버린 레코드 수
+        # DEBUG 레코드를 받을 수 있는 최대 큐 길이 (크기 제한이 없는 큐면 None)
+        self._debug_limit = max(int(log_queue.maxsize * (1 - DEBUG_HEADROOM)), 1) if log_queue.maxsize > 0 else None
+
+    def prepare(self, record):
+        """ %-style 인자만 메시지에 합침 (포매팅/타임스탬프 문자열화는 listener 스레드에서 수행) """
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record):
+        if self.overflow == "block":
+            self.queue.put(record)
+            return
+
+        if (self.overflow == "drop_debug_first" and record.levelno < logging.INFO
+                and self._debug_limit is not None and self.queue.qsize() >= self._debug_limit):
+            self.dropped += 1
+            return
+
+        if self.overflow == "drop":
+            try:
+                self.queue.put_nowait(record)
+            except queue.Full:
+                self.dropped += 1
+        else:
+            # drop_debug_first: INFO 이상은 버리지 않고 자리가 날 때까지 대기
+            self.queue.put(record)
+
+class _DrainingQueueListener(QueueListener):
+    """ 큐가 가득 차 있어도 종료 표식을 넣을 수 있도록 대기하며 넣는 QueueListener """
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
 
 class SimpleLogger:
-    def __init__(self, name: str, log_file: str = 'app.log', log_level: int = logging.INFO, backup_count: int = 7):
+    def __init__(self, name: str, log_file: str = 'app.log', log_level: int = logging.INFO, backup_count: int = 7,
+                 async_mode: bool = False, queue_size: int = 10000, overflow: str = "block",
+                 structured: bool = False, context: dict = None, buffer_size: int = 100, flush_interval: float = 1.0,
+                 compress: bool = False):
         # 로거 설정
         self.logger = logging.getLogger(name)
         self.logger.setLevel(log_level)
-        
+        self._queue_handler = None
+        self._listener = None
+        self._handlers = []
+
         # 시간 기반 파일 핸들러 설정 (하루 단위로 파일 롤링)
-        file_handler = TimedRotatingFileHandler(log_file, when="midnight", interval=1, backupCount=backup_count)
+        if structured or compress:
+            # 구조화 모드는 JSON 줄을 모아서 쓰고, compress=True면 롤오버 파일을 백그라운드에서 gzip 압축
+            file_handler = BufferedTimedRotatingFileHandler(
+                log_file, when="midnight", interval=1, backup_count=backup_count,
+                buffer_size=buffer_size if structured else 1, flush_interval=flush_interval if structured else 0,
+                compress=compress)
+        else:
+            file_handler = TimedRotatingFileHandler(log_file, when="midnight", interval=1, backupCount=backup_count)
         file_handler.setLevel(log_level)
-        
+
         # 콘솔 핸들러 설정 (필요한 경우)
         console_handler = logging.StreamHandler()
         console_handler.setLevel(log_level)
-        
+
         # 포매터 설정
         formatter = logging.Formatter('[%(asctime)s] %(levelname)s in %(module)s: %(message)s')
-        file_handler.setFormatter(formatter)
+        file_handler.setFormatter(JsonFormatter(context) if structured else formatter)
         console_handler.setFormatter(formatter)
-        
-        # 핸들러 추가
-        self.logger.addHandler(file_handler)
-        self.logger.addHandler(console_handler)
-        
+
+        self._handlers = [file_handler, console_handler]
+        if async_mode:
+            # 비동기 모드: 호출 스레드는 큐에 넣기만 하고 파일/콘솔 출력과 롤오버는 listener 스레드에서 수행
+            self._queue_handler = BoundedQueueHandler(queue.Queue(maxsize=queue_size), overflow=overflow)
+            self._listener = _DrainingQueueListener(self._queue_handler.queue, file_handler, console_handler,
+                                                    respect_handler_level=True)
+            self._listener.start()
+            self.logger.addHandler(self._queue_handler)
+            # 종료 시 큐에 남은 레코드를 모두 기록
+            atexit.register(self.close)
+        else:
+            # 핸들러 추가
+            self.logger.addHandler(file_handler)
+            self.logger.addHandler(console_handler)
+
         # 초기화 로그 남기기
         self.logger.info("SimpleLogger initialized with name: %s", name)
-        
-    def log(self, msg: str, log_level: int = logging.INFO):
-        # 로그 메시지를 지정된 레벨로 남기기
-        if log_level == logging.DEBUG:
-            self.logger.debug(msg)
-        elif log_level == logging.INFO:
-            self.logger.info(msg)
-        elif log_level == logging.WARNING:
-            self.logger.warning(msg)
-        elif log_level == logging.ERROR:
-            self.logger.error(msg)
-        elif log_level == logging.CRITICAL:
-            self.logger.critical(msg)
+
+    @property
+    def dropped(self) -> int:
+        """ 비동기 모드에서 큐가 가득 차서 버린 레코드 수 """
+        return self._queue_handler.dropped if self._queue_handler is not None else 0
+
+    def close(self):
+        """ 핸들러를 떼어내고 닫는 메서드 (비동기 모드는 큐, 구조화 모드는 버퍼에 남은 레코드를 모두 기록) """
+        if self._listener is not None:
+            atexit.unregister(self.close)
+            self.logger.removeHandler(self._queue_handler)
+            self._listener.stop()
+            self._listener = None
+
+        handlers, self._handlers = self._handlers, []
+        for handler in handlers:
+            self.logger.removeHandler(handler)
+            handler.close()
+
+    def log(self, msg: str, log_level: int = logging.INFO, *args, **fields):
+        # 로그 메시지를 지정된 레벨로 남기기 (args는 %-style 인자로, 레벨이 꺼져 있으면 포매팅하지 않음)
+        # fields는 구조화(JSON) 모드에서 해당 줄에만 추가되는 필드
+        extra = {"fields": fields} if fields else None
+        if log_level in _KNOWN_LEVELS:
+            if self.logger.isEnabledFor(log_level):
+                self.logger.log(log_level, msg, *args, extra=extra)
         else:
-            self.logger.info("Unknown log level: %s - %s", log_level, msg)
+            self.logger.info("Unknown log level: %s - %s", log_level, msg % args if args else msg, extra=extra)
 
 # 클래스 사용 예시
 if __name__ == "__main__":
     my_logger = SimpleLogger(name="TestLogger")
-    
+
     # 로그 메시지와 로그 레벨을 전달하여 로그 남기기
     my_logger.log("This is an info message")
-    my_logger.log("This is an error message", logging.ERROR)
\ No newline at end of file
+    my_logger.log("This is an error message", logging.ERROR)
+
+    # 비동기 모드: 인자는 %-style로 넘기면 레벨이 꺼져 있을 때 문자열을 만들지 않음
+    async_logger = SimpleLogger(name="AsyncTestLogger", log_file="app_async.log", async_mode=True,
+                                queue_size=1000, overflow="drop_debug_first")
+    async_logger.log("Order %s filled at %.2f", logging.INFO, "KRW-BTC", 50000000.0)
+    async_logger.log("Order book snapshot: %s", logging.DEBUG, {"bids": [], "asks": []})
+    async_logger.close()
+
+    # 구조화 모드: 파일에는 JSON 줄로 기록 (context는 모든 줄에, 키워드 인자는 해당 줄에만 추가)
+    json_logger = SimpleLogger(name="JsonTestLogger", log_file="app.jsonl", structured=True,
+                               context={"service": "order-executor"}, compress=True)
+    json_logger.log("Order %s filled", logging.INFO, "KRW-BTC", order_id=1234, price=50000000.0)
+    json_logger.close()
@@ -0,0 +1,192 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from simpledata import REPLICA_BACKUP_PAGES, SimpleData
+
+class AsyncSimpleData:
+    """ SimpleData 작업을 코루틴으로 제공하는 asyncio 프론트엔드
+
+    쓰기는 DB당 하나의 writer 스레드에서 순서대로 실행하고, 읽기는 크기가 제한된
+    reader 스레드 풀에서 동시에 실행한다. 내부 SimpleData는 풀 모드(WAL)로 열어
+    읽기가 쓰기를 막지 않도록 한다.
+    """
+    def __init__(self, db_path='example.db', max_readers=4, pragmas=None):
+        self.db_path = db_path
+        self._data = SimpleData(db_path, pooled=True, pragmas=pragmas)
+        self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="simpledata-writer")
+        self._readers = ThreadPoolExecutor(max_workers=max_readers, thread_name_prefix="simpledata-reader")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """ 진행 중인 작업을 마친 뒤 스레드와 연결을 정리하는 메서드 """
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._shutdown)
+
+    def _shutdown(self):
+        self._writer.shutdown(wait=True)
+        self._readers.shutdown(wait=True)
+        self._data.close()
+
+    async def _write(self, func, *args, **kwargs):
+        """ writer 스레드에서 실행 (쓰기 직렬화) """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._writer, functools.partial(func, *args, **kwargs))
+
+    async def _read(self, func, *args, **kwargs):
+        """ reader 스레드 풀에서 실행 (읽기 동시 실행) """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._readers, functools.partial(func, *args, **kwargs))
+
+    async def _wait_for(self, fetch, timeout, poll_interval):
+        """ fetch 결과가 비어 있으면 writer 스레드를 잡지 않고 이벤트 루프에서 대기 후 재시도 """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+
+        while True:
+            result = await fetch()
+            if result or deadline is None:
+                return result
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                return result
+            await asyncio.sleep(min(poll_interval, remaining))
+
+    # ========== 계측 ==========
+    def enable_metrics(self, hooks=()):
+        """ 내부 SimpleData 계측을 켜는 메서드 (이벤트 루프를 막지 않는 메모리 작업이라 동기 메서드) """
+        return self._data.enable_metrics(hooks)
+
+    def metrics_snapshot(self):
+        return self._data.metrics_snapshot()
+
+    def export_metrics(self, fmt="json"):
+        return self._data.export_metrics(fmt)
+
+    # ========== 읽기 전용 사본 ==========
+    async def enable_replica(self, replica_path=None, max_lag=5.0, pages=REPLICA_BACKUP_PAGES):
+        """ 사본을 만들고 조회를 사본으로 보냄 (첫 backup은 reader 스레드에서 실행) """
+        return await self._read(self._data.enable_replica, replica_path, max_lag, pages)
+
+    async def refresh_replica(self):
+        return await self._read(self._data.refresh_replica)
+
+    def replica_lag(self):
+        return self._data.replica_lag()
+
+    # ========== 문자열 큐 ==========
+    async def add_string(self, table_type, text_value):
+        return await self._write(self._data.add_string, table_type, text_value)
+
+    async def add_strings(self, table_type, text_values):
+        return await self._write(self._data.add_strings, table_type, list(text_values))
+
+    async def load_strings(self, table_type):
+        return await self._write(self._data.load_strings, table_type)
+
+    # 대기는 이벤트 루프에서 하고, 매 시도는 계측되는 공개 메서드를 timeout=None(한 번만 조회)으로 호출
+    async def pop_strings(self, table_type, limit=100, timeout=None, poll_interval=0.1):
+        return await self._wait_for(
+            lambda: self._write(self._data.pop_strings, table_type, limit, None), timeout, poll_interval)
+
+    async def reserve_strings(self, table_type, limit=100, visibility_timeout=30.0, timeout=None, poll_interval=0.1):
+        return await self._wait_for(
+            lambda: self._write(self._data.reserve_strings, table_type, limit, visibility_timeout, None),
+            timeout, poll_interval)
+
+    async def ack_strings(self, table_type, ids):
+        return await self._write(self._data.ack_strings, table_type, list(ids))
+
+    # ========== common_data ==========
+    async def insert_common_data(self, data_type, value1, value2, value3, value4, number1, number2, number3, number4, record_date):
+        return await self._write(self._data.insert_common_data, data_type, value1, value2, value3, value4,
+                                 number1, number2, number3, number4, record_date)
+
+    async def insert_common_data_many(self, records, **kwargs):
+        return await self._write(self._data.insert_common_data_many, records, **kwargs)
+
+    async def get_common_data(self, data_type, query_date, columns=None, as_frame=False):
+        return await self._read(self._data.get_common_data, data_type, query_date, columns, as_frame)
+
+    async def get_common_data_between_dates(self, data_type, start_date, end_date, columns=None, as_frame=False):
+        return await self._read(self._data.get_common_data_between_dates, data_type, start_date, end_date,
+                                columns, as_frame)
+
+    async def update_common_data(self, record_id, value1, value2, value3, value4, number1, number2, number3, number4, record_date):
+        return await self._write(self._data.update_common_data, record_id, value1, value2, value3, value4,
+                                 number1, number2, number3, number4, record_date)
+
+    async def delete_common_data_by_id(self, record_id):
+        return await self._write(self._data.delete_common_data_by_id, record_id)
+
+    async def delete_common_data(self, days, batch_size=None):
+        return await self._write(self._data.delete_common_data, days, batch_size)
+
+    # ========== OHLCV ==========
+    async def insert_ohlcv_data(self, ticker, df, **kwargs):
+        return await self._write(self._data.insert_ohlcv_data, ticker, df, **kwargs)
+
+    async def insert_ohlcv_data_many(self, frames, **kwargs):
+        return await self._write(self._data.insert_ohlcv_data_many, frames, **kwargs)
+
+    async def delete_ohlcv_by_ticker(self, ticker):
+        return await self._write(self._data.delete_ohlcv_by_ticker, ticker)
+
+    async def delete_old_ohlcv_data(self, years=2, batch_size=None):
+        return await self._write(self._data.delete_old_ohlcv_data, years, batch_size)
+
+    async def purge_old_data(self, **kwargs):
+        return await self._write(self._data.purge_old_data, **kwargs)
+
+    async def enable_rollups(self, *args, **kwargs):
+        return await self._write(self._data.enable_rollups, *args, **kwargs)
+
+    async def get_ohlcv_data(self, ticker, start_date, end_date, interval=None, as_frame=True):
+        return await self._read(self._data.get_ohlcv_data, ticker, start_date, end_date, interval, as_frame)
+
+    async def get_ohlcv_data_many(self, tickers, start_date, end_date, multi_index=False, interval=None,
+                                  as_frame=True):
+        return await self._read(self._data.get_ohlcv_data_many, list(tickers), start_date, end_date,
+                                multi_index, interval, as_frame)
+
+    async def get_latest_ohlcv_timestamp(self, ticker):
+        return await self._read(self._data.get_latest_ohlcv_timestamp, ticker)
+
+    async def get_latest_ohlcv_timestamps(self, tickers=None):
+        return await self._read(self._data.get_latest_ohlcv_timestamps, None if tickers is None else list(tickers))
+
+    async def iter_ohlcv_data(self, ticker, start_date, end_date, **kwargs):
+        """ iter_ohlcv_data의 비동기 버전 (chunk 하나씩 읽음)
+
+        제너레이터가 잡은 풀 연결은 그 연결을 만든 스레드에서만 써야 하므로, 반복 전체를
+        reader 풀이 아닌 전용 스레드 하나에서 실행한다.
+        """
+        loop = asyncio.get_running_loop()
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="simpledata-iter")
+        chunks = self._data.iter_ohlcv_data(ticker, start_date, end_date, **kwargs)
+        try:
+            while True:
+                chunk = await loop.run_in_executor(executor, next, chunks, None)
+                if chunk is None:
+                    return
+                yield chunk
+        finally:
+            await loop.run_in_executor(executor, chunks.close)
+            executor.shutdown(wait=False)
+
+# 사용 예제
+if __name__ == "__main__":
+    from simpledata import TableType
+
+    async def main():
+        async with AsyncSimpleData(db_path='example.db') as data:
+            await asyncio.gather(*(data.add_string(TableType.Msg, f"async message {i}") for i in range(10)))
+            print(f"Loaded strings: {await data.pop_strings(TableType.Msg, limit=100, timeout=1.0)}")
+
+    asyncio.run(main())
@@ -0,0 +1,109 @@
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+# synthetic 모듈은 pandas를 import하므로 쓰지 않고, 자식 프로세스에서 저장소 루트를 직접 경로에 추가
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 자식 프로세스 공통 머리말: import 시간과 전체 시간을 재고 마지막에 최대 RSS / pandas 로드 여부를 출력
+PRELUDE = '''
+import sys, time
+started = time.perf_counter()
+sys.path.insert(0, {root!r})
+import simpledata
+from simpledata import SimpleData, TableType
+imported = time.perf_counter()
+db_path = {db_path!r}
+'''
+
+REPORT = '''
+import json, resource
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "total_ms": (time.perf_counter() - started) * 1000,
+    "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "pandas": "pandas" in sys.modules,
+    "numpy": "numpy" in sys.modules,
+}))
+'''
+
+# 시나리오: (이름, 본문) - 본문은 PRELUDE 다음에 실행
+SCENARIOS = [
+    ("import only", ""),
+    ("string queue", '''
+with SimpleData(db_path) as simple_data:
+    simple_data.add_strings(TableType.Msg, [f"alert {i}" for i in range(1000)])
+    while simple_data.pop_strings(TableType.Msg, limit=500):
+        pass
+'''),
+    ("common_data rows", '''
+import datetime
+day = datetime.datetime(2024, 1, 1)
+with SimpleData(db_path) as simple_data:
+    simple_data.insert_common_data_many(
+        [("metric", f"KRW-T{i % 50:03d}", "buy", None, None, float(i), 0.0, 0.0, 0.0, day) for i in range(1000)])
+    simple_data.get_common_data("metric", day)
+'''),
+    ("ohlcv rows (as_frame=False)", '''
+import datetime
+start = datetime.datetime(1900, 1, 1)
+end = datetime.datetime(2100, 1, 1)
+with SimpleData(db_path) as simple_data:
+    simple_data.get_ohlcv_data("KRW-BTC", start, end, as_frame=False)
+'''),
+    ("ohlcv DataFrame", '''
+import datetime
+start = datetime.datetime(1900, 1, 1)
+end = datetime.datetime(2100, 1, 1)
+with SimpleData(db_path) as simple_data:
+    simple_data.get_ohlcv_data("KRW-BTC", start, end)
+'''),
+]
+
+
+def run_child(code):
+    """ 새 인터프리터에서 code를 실행하고 마지막 줄의 JSON 결과를 반환 """
+    completed = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def run(name, body, db_path, repeat):
+    code = PRELUDE.format(root=ROOT_DIR, db_path=db_path) + body + REPORT
+    results = [run_child(code) for _ in range(repeat)]
+    import_ms = statistics.median(r["import_ms"] for r in results)
+    total_ms = statistics.median(r["total_ms"] for r in results)
+    rss_mb = statistics.median(r["rss_mb"] for r in results)
+    loaded = ", ".join(module for module in ("numpy", "pandas") if results[-1][module]) or "-"
+    print(f"{name:<30} import {import_ms:>7.1f}ms  total {total_ms:>7.1f}ms  max RSS {rss_mb:>6.1f}MB  "
+          f"loaded: {loaded}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="simpledata import 시간 / 최대 RSS 측정 (pandas 지연 로드 확인)")
+    parser.add_argument("--repeat", type=int, default=5, help="시나리오별 프로세스 실행 횟수 (중앙값 출력)")
+    args = parser.parse_args()
+
+    baseline = run_child("import json, resource, sys\nprint(json.dumps({'rss_mb': "
+                         "resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024}))")
+    print(f"bare interpreter               max RSS {baseline['rss_mb']:>6.1f}MB")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "bench.db")
+        # OHLCV 시나리오용 데이터 준비 (pandas를 쓰므로 별도 프로세스에서)
+        run_child(PRELUDE.format(root=ROOT_DIR, db_path=db_path) + '''
+import contextlib, io
+import pandas as pd
+frame = pd.DataFrame({
+    "timestamp": pd.date_range("2024-01-01", periods=5000, freq="min"),
+    "open": 1.0, "high": 1.0, "low": 1.0, "close": 1.0, "volume": 1.0, "value": 1.0,
+})
+with contextlib.redirect_stdout(io.StringIO()), SimpleData(db_path) as simple_data:
+    simple_data.insert_ohlcv_data("KRW-BTC", frame)
+''' + REPORT)
+
+        for name, body in SCENARIOS:
+            run(name, body, db_path, args.repeat)
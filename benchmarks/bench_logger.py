@@ -0,0 +1,92 @@
+import argparse
+import contextlib
+import logging
+import os
+import tempfile
+import time
+
+import numpy as np
+
+import synthetic  # noqa: F401  (저장소 루트 경로 추가)
+from Logging import OVERFLOW_POLICIES, SimpleLogger
+
+
+def make_logger(tmp_dir, name, devnull, **options):
+    """ 콘솔 출력은 /dev/null로 보내는 SimpleLogger 생성 (StreamHandler는 생성 시점의 stderr를 잡음) """
+    with contextlib.redirect_stderr(devnull):
+        return SimpleLogger(name=name, log_file=os.path.join(tmp_dir, f"{name}.log"), **options)
+
+
+def run(name, simple_logger, count, log_call):
+    """ log_call(simple_logger, i)를 count번 호출하며 호출 스레드가 막힌 시간만 측정 """
+    latencies = np.empty(count)
+    for i in range(count):
+        started = time.perf_counter()
+        log_call(simple_logger, i)
+        latencies[i] = time.perf_counter() - started
+
+    drained = time.perf_counter()
+    simple_logger.close()  # 비동기 모드는 큐에 남은 레코드를 여기서 기록
+    drain = time.perf_counter() - drained
+
+    p50, p99, p999 = np.percentile(latencies, [50, 99, 99.9]) * 1e6
+    print(f"{name:<38} {count / latencies.sum():>12,.0f} calls/sec  p50 {p50:>7.1f}us  p99 {p99:>7.1f}us  "
+          f"p99.9 {p999:>8.1f}us  max {latencies.max() * 1e6:>9.1f}us  drain {drain:>6.3f}s  "
+          f"dropped {simple_logger.dropped}")
+
+
+def info_call(simple_logger, i):
+    simple_logger.log("order %d filled: %s @ %.2f", logging.INFO, i, "KRW-BTC", 50_000_000.0)
+
+
+def eager_debug_call(simple_logger, i):
+    simple_logger.log(f"order book #{i}: {[(50_000_000.0 + k, k) for k in range(5)]}", logging.DEBUG)
+
+
+def lazy_debug_call(simple_logger, i):
+    simple_logger.log("order book #%d: %s", logging.DEBUG, i, [(50_000_000.0 + k, k) for k in range(5)])
+
+
+def lazy_debug_args_call(simple_logger, i):
+    simple_logger.log("order book #%d: %s", logging.DEBUG, i, "levels")
+
+
+def mixed_call(simple_logger, i):
+    if i % 4:
+        simple_logger.log("order book #%d", logging.DEBUG, i)
+    else:
+        info_call(simple_logger, i)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SimpleLogger.log 호출 측(caller) 지연 시간: 동기 vs 비동기 모드")
+    parser.add_argument("--count", type=int, default=50000)
+    parser.add_argument("--queue-size", type=int, default=10000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir, open(os.devnull, "w") as devnull:
+        run("sync info", make_logger(tmp_dir, "sync", devnull), args.count, info_call)
+        for overflow in OVERFLOW_POLICIES:
+            simple_logger = make_logger(tmp_dir, f"async-{overflow}", devnull, async_mode=True,
+                                        queue_size=args.queue_size, overflow=overflow)
+            run(f"async info ({overflow})", simple_logger, args.count, info_call)
+
+        # 구조화(JSON) 모드: 줄마다 쓰기 vs buffer_size개씩 모아서 쓰기
+        run("structured info (unbuffered)", make_logger(tmp_dir, "json-unbuffered", devnull, structured=True,
+                                                        buffer_size=1), args.count, info_call)
+        run("structured info (buffered)", make_logger(tmp_dir, "json-buffered", devnull, structured=True,
+                                                      buffer_size=500), args.count, info_call)
+        run("structured info (async, buffered)", make_logger(tmp_dir, "json-async", devnull, structured=True,
+                                                             buffer_size=500, async_mode=True), args.count, info_call)
+
+        # DEBUG를 켠 상태에서 3/4가 DEBUG인 폭주 상황: drop_debug_first는 INFO를 지키며 DEBUG만 버림
+        for overflow in OVERFLOW_POLICIES:
+            simple_logger = make_logger(tmp_dir, f"burst-{overflow}", devnull, log_level=logging.DEBUG,
+                                        async_mode=True, queue_size=args.queue_size // 10, overflow=overflow)
+            run(f"async debug burst ({overflow})", simple_logger, args.count, mixed_call)
+
+        # INFO 레벨에서 꺼진 DEBUG 호출: f-string은 매번 문자열을 만들지만 %-style 인자는 포매팅 생략
+        run("filtered debug (f-string)", make_logger(tmp_dir, "eager", devnull), args.count, eager_debug_call)
+        run("filtered debug (%-args)", make_logger(tmp_dir, "lazy", devnull), args.count, lazy_debug_call)
+        run("filtered debug (%-args, cheap)", make_logger(tmp_dir, "lazy-cheap", devnull), args.count,
+            lazy_debug_args_call)
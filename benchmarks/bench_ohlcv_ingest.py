@@ -0,0 +1,67 @@
+import argparse
+import contextlib
+import io
+import os
+import sqlite3
+import tempfile
+import time
+
+from synthetic import create_legacy_ohlcv_table, make_ohlcv_frames
+from simpledata import SimpleData, TableType
+
+
+def legacy_insert_ohlcv_data(simple_data, ticker, df):
+    """ 기존 iterrows + 행 단위 REPLACE INTO 구현 (비교 기준) """
+    conn = sqlite3.connect(simple_data.db_path, timeout=10)
+    cursor = conn.cursor()
+    create_legacy_ohlcv_table(conn)
+
+    if "timestamp" not in df.columns:
+        df["timestamp"] = df.index
+    df["timestamp"] = df["timestamp"].astype(str)
+    df["price_change"] = df["close"].pct_change() * 100
+    df["ticker"] = ticker
+
+    for _, row in df.iterrows():
+        cursor.execute(f'''
+            REPLACE INTO {TableType.OHLCV.value}
+            (ticker, timestamp, open, high, low, close, volume, value, price_change)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (
+            row["ticker"], row["timestamp"], row["open"], row["high"],
+            row["low"], row["close"], row["volume"], row["value"], row["price_change"]
+        ))
+
+    conn.commit()
+    cursor.close()
+    conn.close()
+
+
+def run(name, func, frames):
+    """ 새 DB 파일에 func(simple_data, frames)를 실행하고 rows/sec를 출력 """
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        simple_data = SimpleData(db_path=os.path.join(tmp_dir, "bench.db"))
+        total_rows = sum(len(df) for df in frames.values())
+        # 각 구현이 원본 DataFrame을 변경하므로 복사본으로 실행
+        frames = {ticker: df.copy() for ticker, df in frames.items()}
+
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            func(simple_data, frames)
+        elapsed = time.perf_counter() - started
+
+        print(f"{name:<28} {total_rows:>10} rows {elapsed:>8.3f}s {total_rows / elapsed:>12,.0f} rows/sec")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="OHLCV 저장 경로 rows/sec 비교")
+    parser.add_argument("--tickers", type=int, default=20)
+    parser.add_argument("--rows", type=int, default=5000, help="티커당 행 수")
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    frames = make_ohlcv_frames(args.tickers, args.rows)
+
+    run("legacy iterrows loop", lambda sd, fr: [legacy_insert_ohlcv_data(sd, t, df) for t, df in fr.items()], frames)
+    run("insert_ohlcv_data", lambda sd, fr: [sd.insert_ohlcv_data(t, df, chunk_size=args.chunk_size) for t, df in fr.items()], frames)
+    run("insert_ohlcv_data_many", lambda sd, fr: sd.insert_ohlcv_data_many(fr, chunk_size=args.chunk_size), frames)
@@ -0,0 +1,98 @@
+import argparse
+import contextlib
+import datetime
+import io
+import os
+import random
+import shutil
+import sqlite3
+import tempfile
+import time
+
+from synthetic import create_legacy_ohlcv_table, make_ohlcv_frames
+from simpledata import SimpleData
+
+
+def build_legacy_db(db_path, frames):
+    """ 기존 TEXT timestamp 형식으로 OHLCV DB를 만드는 함수 """
+    conn = sqlite3.connect(db_path)
+    create_legacy_ohlcv_table(conn)
+    conn.commit()
+    conn.close()
+
+    # 테이블이 TEXT 형식이므로 SimpleData가 기존 형식으로 저장함
+    with contextlib.redirect_stdout(io.StringIO()):
+        SimpleData(db_path).insert_ohlcv_data_many(frames)
+
+
+def measure(simple_data, tickers, first, last, repeat):
+    """ 범위 조회 / 최신 timestamp / 보관기간 삭제 대상 카운트의 평균 지연(ms) 측정 """
+    rng = random.Random(0)
+    window = datetime.timedelta(days=7)
+    span = (last - first - window).total_seconds()
+    timings = {}
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        start = first + datetime.timedelta(seconds=rng.uniform(0, span))
+        simple_data.get_ohlcv_data(rng.choice(tickers), start, start + window)
+    timings["get_ohlcv_data (7d)"] = (time.perf_counter() - started) / repeat * 1000
+
+    started = time.perf_counter()
+    for _ in range(repeat):
+        simple_data.get_latest_ohlcv_timestamp(rng.choice(tickers))
+    timings["get_latest_ohlcv_timestamp"] = (time.perf_counter() - started) / repeat * 1000
+
+    started = time.perf_counter()
+    simple_data.get_latest_ohlcv_timestamps(tickers)
+    timings["get_latest_ohlcv_timestamps"] = (time.perf_counter() - started) * 1000
+
+    # delete_old_ohlcv_data와 같은 조건의 스캔 비용 (데이터는 지우지 않음)
+    conn = simple_data._connect()
+    cutoff = simple_data._ohlcv_ts_param(conn, first + (last - first) / 2)
+    started = time.perf_counter()
+    conn.execute("SELECT COUNT(*) FROM table_ohlcv_data WHERE timestamp < ?", (cutoff,)).fetchone()
+    timings["retention scan (timestamp < ?)"] = (time.perf_counter() - started) * 1000
+    simple_data._release(conn)
+
+    return timings
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="TEXT vs epoch 밀리초 OHLCV 저장 형식 크기/지연 비교")
+    parser.add_argument("--tickers", type=int, default=50)
+    parser.add_argument("--rows", type=int, default=70080, help="티커당 행 수 (기본: 15분봉 2년)")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    frames = make_ohlcv_frames(args.tickers, args.rows)
+    tickers = list(frames)
+    first = frames[tickers[0]].index[0].to_pydatetime()
+    last = frames[tickers[0]].index[-1].to_pydatetime()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        legacy_path = os.path.join(tmp_dir, "legacy.db")
+        epoch_path = os.path.join(tmp_dir, "epoch.db")
+
+        build_legacy_db(legacy_path, frames)
+        shutil.copyfile(legacy_path, epoch_path)
+
+        started = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            migrated = SimpleData(epoch_path).migrate_ohlcv_to_epoch()
+        print(f"migration: {migrated} rows in {time.perf_counter() - started:.2f}s")
+
+        # 동일 조건 비교를 위해 기존 형식 DB도 VACUUM
+        conn = sqlite3.connect(legacy_path)
+        conn.execute("VACUUM")
+        conn.close()
+
+        results = {}
+        for name, path in (("TEXT", legacy_path), ("epoch ms", epoch_path)):
+            with contextlib.redirect_stdout(io.StringIO()):
+                results[name] = measure(SimpleData(path), tickers, first, last, args.repeat)
+            results[name]["file size (MB)"] = os.path.getsize(path) / 1024 / 1024
+
+        print(f"{'':<34}{'TEXT':>14}{'epoch ms':>14}")
+        for metric in results["TEXT"]:
+            print(f"{metric:<34}{results['TEXT'][metric]:>14.3f}{results['epoch ms'][metric]:>14.3f}")
@@ -0,0 +1,58 @@
+import argparse
+import contextlib
+import datetime
+import io
+import os
+import tempfile
+import time
+
+from synthetic import make_ohlcv_frames
+from simpledata import SimpleData
+from parallelloader import load_ohlcv_parallel
+
+
+def build_db(db_path, tickers, rows, batch):
+    """ 합성 OHLCV DB 생성 (batch개 티커씩 나눠 저장하여 메모리 사용 제한) """
+    simple_data = SimpleData(db_path)
+    for start in range(0, tickers, batch):
+        frames = make_ohlcv_frames(min(batch, tickers - start), rows)
+        frames = {f"KRW-S{start + i:04d}": df for i, df in enumerate(frames.values())}
+        with contextlib.redirect_stdout(io.StringIO()):
+            simple_data.insert_ohlcv_data_many(frames)
+    return [f"KRW-S{i:04d}" for i in range(tickers)]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="load_ohlcv_parallel 코어 수 확장성 측정")
+    parser.add_argument("--tickers", type=int, default=64)
+    parser.add_argument("--rows", type=int, default=70080, help="티커당 행 수 (기본: 15분봉 2년, 64티커 ≈ 0.4GB)")
+    parser.add_argument("--db", help="기존 DB 경로 (지정하지 않으면 임시 DB 생성)")
+    parser.add_argument("--max-processes", type=int, default=os.cpu_count() or 1)
+    args = parser.parse_args()
+
+    start_date = datetime.datetime(1900, 1, 1)
+    end_date = datetime.datetime(2100, 1, 1)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = args.db or os.path.join(tmp_dir, "bench.db")
+        if args.db:
+            tickers = list(SimpleData(db_path, read_only=True).get_latest_ohlcv_timestamps())
+        else:
+            tickers = build_db(db_path, args.tickers, args.rows, batch=16)
+        print(f"database: {os.path.getsize(db_path) / 1024 / 1024:,.0f} MB, {len(tickers)} tickers")
+
+        simple_data = SimpleData(db_path, read_only=True)
+        started = time.perf_counter()
+        total_rows = sum(len(simple_data.get_ohlcv_data(t, start_date, end_date)) for t in tickers)
+        baseline = time.perf_counter() - started
+        print(f"{'sequential get_ohlcv_data':<28} {baseline:>8.2f}s {total_rows / baseline:>14,.0f} rows/sec")
+
+        processes = 1
+        while processes <= args.max_processes:
+            started = time.perf_counter()
+            frames = load_ohlcv_parallel(db_path, tickers, start_date, end_date, processes=processes)
+            elapsed = time.perf_counter() - started
+            rows = sum(len(df) for df in frames.values())
+            print(f"{f'parallel x{processes}':<28} {elapsed:>8.2f}s {rows / elapsed:>14,.0f} rows/sec "
+                  f"(speedup {baseline / elapsed:.2f}x)")
+            processes *= 2
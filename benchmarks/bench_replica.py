@@ -0,0 +1,76 @@
+import argparse
+import contextlib
+import datetime
+import io
+import os
+import tempfile
+import threading
+import time
+
+import numpy as np
+
+from synthetic import make_ohlcv_frame, make_ohlcv_frames
+from simpledata import SimpleData
+
+
+def run(name, db_path, tickers, args, replica):
+    """ 분석용 읽기 스레드가 큰 범위를 계속 조회하는 동안 writer의 insert_ohlcv_data 지연 시간 측정 """
+    simple_data = SimpleData(db_path)
+    if replica:
+        simple_data.enable_replica(max_lag=args.max_lag)
+
+    start_date = datetime.datetime(1900, 1, 1)
+    end_date = datetime.datetime(2100, 1, 1)
+    stop = threading.Event()
+    reads = []
+
+    def reader():
+        while not stop.is_set():
+            started = time.perf_counter()
+            simple_data.get_ohlcv_data_many(tickers, start_date, end_date)
+            reads.append(time.perf_counter() - started)
+
+    frame = make_ohlcv_frame(args.batch * args.writes, start=datetime.datetime(2030, 1, 1))
+    latencies = []
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        threads = [threading.Thread(target=reader) for _ in range(args.readers)]
+        for thread in threads:
+            thread.start()
+        for i in range(args.writes):
+            started = time.perf_counter()
+            simple_data.insert_ohlcv_data("KRW-WRITER", frame.iloc[i * args.batch:(i + 1) * args.batch])
+            latencies.append(time.perf_counter() - started)
+            time.sleep(args.pause)
+        stop.set()
+        for thread in threads:
+            thread.join()
+    simple_data.close()
+
+    errors = output.getvalue().count("error occurred")
+    p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+    print(f"{name:<22} writes p50 {p50:>8.2f}ms  p99 {p99:>8.2f}ms  max {max(latencies) * 1000:>8.2f}ms  "
+          f"errors {errors:>3}  reads {len(reads):>4} (avg {np.mean(reads) * 1000 if reads else 0:>7.1f}ms)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="읽기 전용 사본(enable_replica) 사용 시 분석 조회 중 쓰기 지연 비교")
+    parser.add_argument("--tickers", type=int, default=16)
+    parser.add_argument("--rows", type=int, default=20000, help="티커당 행 수")
+    parser.add_argument("--readers", type=int, default=2)
+    parser.add_argument("--writes", type=int, default=50)
+    parser.add_argument("--batch", type=int, default=100)
+    parser.add_argument("--pause", type=float, default=0.02, help="쓰기 사이 대기 시간 (초)")
+    parser.add_argument("--max-lag", type=float, default=2.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_path = os.path.join(tmp_dir, "bench.db")
+        with contextlib.redirect_stdout(io.StringIO()), SimpleData(db_path) as simple_data:
+            frames = make_ohlcv_frames(args.tickers, args.rows)
+            simple_data.insert_ohlcv_data_many(frames)
+        tickers = list(frames)
+        print(f"database: {os.path.getsize(db_path) / 1024 / 1024:,.0f} MB, rollback journal mode")
+
+        run("primary only", db_path, tickers, args, replica=False)
+        run("reads on replica", db_path, tickers, args, replica=True)
@@ -0,0 +1,49 @@
+import argparse
+import os
+import tempfile
+import time
+
+import synthetic  # noqa: F401  (저장소 루트 경로 추가)
+from simpledata import SimpleData, TableType
+
+
+def run(name, pooled, write, count):
+    """ 새 DB 파일에 count개 메시지를 write(simple_data, messages)로 저장하고 msgs/sec를 출력 """
+    messages = [f"alert message #{i}" for i in range(count)]
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        with SimpleData(os.path.join(tmp_dir, "bench.db"), pooled=pooled) as simple_data:
+            started = time.perf_counter()
+            write(simple_data, messages)
+            simple_data.flush_writes()
+            elapsed = time.perf_counter() - started
+
+            stored = len(simple_data.load_strings(TableType.Msg))
+
+    mode = "pooled" if pooled else "plain"
+    print(f"{name:<24} {mode:<7} {stored:>8} msgs {elapsed:>8.3f}s {count / elapsed:>12,.0f} msgs/sec")
+
+
+def add_string_loop(simple_data, messages):
+    for message in messages:
+        simple_data.add_string(TableType.Msg, message)
+
+
+def add_strings_bulk(simple_data, messages):
+    simple_data.add_strings(TableType.Msg, messages)
+
+
+def buffered_add_string(simple_data, messages):
+    simple_data.enable_write_buffer(max_items=500, flush_interval=0.5)
+    add_string_loop(simple_data, messages)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="add_string / add_strings / 쓰기 버퍼 처리량 비교")
+    parser.add_argument("--count", type=int, default=5000)
+    args = parser.parse_args()
+
+    for pooled in (False, True):
+        run("add_string loop", pooled, add_string_loop, args.count)
+        run("add_strings bulk", pooled, add_strings_bulk, args.count)
+        run("buffered add_string", pooled, buffered_add_string, args.count)
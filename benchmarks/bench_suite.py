@@ -0,0 +1,423 @@
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import logging
+import os
+import platform
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from synthetic import ROOT_DIR, make_common_records, make_messages, make_ohlcv_frame, make_ohlcv_frames
+from simpledata import COMMON_DATA_COLUMNS, SimpleData, TableType
+from Logging import SimpleLogger
+
+START_DATE = datetime.datetime(1900, 1, 1)
+END_DATE = datetime.datetime(2100, 1, 1)
+
+# 다중 프로세스 경합 측정에서 워커가 번갈아 실행하는 작업 (쓰기/읽기 혼합)
+MIXED_WORKLOAD = (
+    "add_strings", "pop_strings", "insert_ohlcv_data", "get_ohlcv_data",
+    "insert_common_data", "get_common_data_between_dates", "get_latest_ohlcv_timestamps",
+)
+
+
+def percentile_ms(latencies, q):
+    return float(np.percentile(latencies, q) * 1000) if len(latencies) else None
+
+
+def summarize(suite, name, mode, latencies, rows=None, seconds=None, errors=0):
+    """ 호출별 지연 시간(초) 목록을 처리량 / p50 / p99 결과 dict로 요약 """
+    seconds = float(np.sum(latencies)) if seconds is None else seconds
+    calls = len(latencies)
+    return {
+        "suite": suite,
+        "name": name,
+        "mode": mode,
+        "calls": calls,
+        "rows": rows,
+        "seconds": seconds,
+        "ops_per_sec": calls / seconds if seconds else None,
+        "rows_per_sec": rows / seconds if rows and seconds else None,
+        "p50_ms": percentile_ms(latencies, 50),
+        "p99_ms": percentile_ms(latencies, 99),
+        "errors": errors,
+    }
+
+
+def measure(call, iterations, setup=None):
+    """ call(i)를 iterations번 실행하며 호출별 지연 시간과 처리 행 수 합계 반환 (setup(i)은 시간에서 제외) """
+    latencies = []
+    rows = 0
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):  # SimpleData의 진행 메시지(print)는 숨기고 오류 수만 집계
+        for i in range(iterations):
+            if setup is not None:
+                setup(i)
+            started = time.perf_counter()
+            result = call(i)
+            latencies.append(time.perf_counter() - started)
+            rows += result or 0
+    errors = output.getvalue().count("error occurred")
+    return latencies, rows or None, errors
+
+
+def seed_database(db_path, tickers, rows, messages, common_records):
+    """ 합성 OHLCV / common_data / 메시지 데이터로 벤치마크 DB를 채움 (티커 목록 반환) """
+    with contextlib.redirect_stdout(io.StringIO()), SimpleData(db_path) as simple_data:
+        simple_data.insert_ohlcv_data_many(make_ohlcv_frames(tickers, rows))
+        simple_data.add_strings(TableType.Msg, make_messages(messages))
+        simple_data.add_strings(TableType.Check, make_messages(messages, prefix="check"))
+        simple_data.insert_common_data_many(common_records)
+
+    return [f"KRW-T{i:03d}" for i in range(tickers)]
+
+
+def single_process_cases(simple_data, tickers, args, tmp_dir):
+    """ (이름, 반복 수, call(i), setup(i)) 목록 (SimpleData 공개 메서드별 측정 항목) """
+    n = args.iterations
+    batch = args.batch
+    messages = make_messages(batch)
+    records = make_common_records(n, start=datetime.datetime(2024, 1, 1))
+    first_day = datetime.datetime(2024, 1, 1)
+    reserved = []
+    new_frames = {}
+    common_batches = {}
+    last_timestamp = pd.Timestamp(make_ohlcv_frame(args.rows).index[-1])
+
+    def append_frame(i):
+        start = last_timestamp + pd.Timedelta(minutes=15) * (1 + i * batch)
+        return make_ohlcv_frame(batch, start=start, seed=i)
+
+    def prepare_new_frames(i):
+        new_frames[i] = {f"KRW-M{i:03d}{k}": df for k, df in enumerate(make_ohlcv_frames(4, batch).values())}
+
+    def add_old_rows(i):
+        simple_data.insert_ohlcv_data(f"KRW-OLD{i:03d}", make_ohlcv_frame(batch, start=datetime.datetime(2015, 1, 1)))
+
+    def refill_strings(i):
+        simple_data.add_strings(TableType.Msg, messages)
+
+    def refill_common(i):
+        simple_data.insert_common_data_many(make_common_records(batch, start=datetime.datetime(2015, 1, 1), seed=i))
+
+    def prepare_common_records(i):
+        common_batches[i] = make_common_records(batch, seed=i)
+
+    def prepare_common_frame(i):
+        common_batches[i] = pd.DataFrame(make_common_records(batch, seed=i), columns=COMMON_DATA_COLUMNS[1:])
+
+    def reserve(i):
+        items = simple_data.reserve_strings(TableType.Check, limit=batch, visibility_timeout=600)
+        reserved.append([item_id for item_id, _ in items])
+        return len(items)
+
+    def purge(i):
+        report = simple_data.purge_old_data(ohlcv_years=2, common_days=365, batch_size=batch, pause=0)
+        return report["ohlcv_rows"] + report["common_rows"]
+
+    def export(i):
+        exported = simple_data.export_ohlcv_snapshot(os.path.join(tmp_dir, f"snapshot{i}"), tickers=tickers[:4])
+        return sum(item["rows"] for item in exported.values())
+
+    return [
+        # 문자열 큐
+        ("add_string", n, lambda i: simple_data.add_string(TableType.Msg, messages[i % batch]) or 1, None),
+        ("add_strings", n, lambda i: simple_data.add_strings(TableType.Msg, messages), None),
+        ("pop_strings", n, lambda i: len(simple_data.pop_strings(TableType.Msg, limit=batch)), None),
+        ("load_strings", max(n // 10, 1), lambda i: len(simple_data.load_strings(TableType.Msg)), refill_strings),
+        ("reserve_strings", n, reserve, None),
+        ("ack_strings", n, lambda i: simple_data.ack_strings(TableType.Check, reserved.pop() if reserved else []),
+         None),
+        # common_data
+        ("insert_common_data", n, lambda i: simple_data.insert_common_data(*records[i]) or 1, None),
+        ("insert_common_data_many", max(n // 10, 1),
+         lambda i: simple_data.insert_common_data_many(common_batches.pop(i)), prepare_common_records),
+        ("insert_common_data_many[frame]", max(n // 10, 1),
+         lambda i: simple_data.insert_common_data_many(common_batches.pop(i)), prepare_common_frame),
+        ("get_common_data", n,
+         lambda i: len(simple_data.get_common_data("metric", first_day + datetime.timedelta(days=i % 30))), None),
+        ("get_common_data[frame]", n,
+         lambda i: len(simple_data.get_common_data("metric", first_day + datetime.timedelta(days=i % 30),
+                                                   columns=["date", "number1"], as_frame=True)), None),
+        ("get_common_data_between_dates", n,
+         lambda i: len(simple_data.get_common_data_between_dates(
+             "signal", first_day, first_day + datetime.timedelta(days=1 + i % 30))), None),
+        ("update_common_data", n, lambda i: simple_data.update_common_data(i + 1, *records[i][1:]) or 1, None),
+        ("delete_common_data_by_id", n, lambda i: simple_data.delete_common_data_by_id(i + 1) or 1, None),
+        ("delete_common_data", max(n // 20, 1), lambda i: simple_data.delete_common_data(365), refill_common),
+        # OHLCV 쓰기
+        ("insert_ohlcv_data", n,
+         lambda i: simple_data.insert_ohlcv_data(f"KRW-N{i:03d}", append_frame(0)) or batch, None),
+        ("insert_ohlcv_data[incremental]", n,
+         lambda i: simple_data.insert_ohlcv_data(tickers[0], append_frame(i), incremental=True) or batch, None),
+        ("insert_ohlcv_data_many", max(n // 10, 1), lambda i: simple_data.insert_ohlcv_data_many(new_frames.pop(i)),
+         prepare_new_frames),
+        ("delete_ohlcv_by_ticker", n, lambda i: simple_data.delete_ohlcv_by_ticker(f"KRW-N{i:03d}"), None),
+        # OHLCV 읽기
+        ("get_ohlcv_data", n,
+         lambda i: len(simple_data.get_ohlcv_data(tickers[i % len(tickers)], START_DATE, END_DATE)), None),
+        ("iter_ohlcv_data", n, lambda i: sum(len(chunk) for chunk in simple_data.iter_ohlcv_data(
+            tickers[i % len(tickers)], START_DATE, END_DATE, chunk_size=1000)), None),
+        ("get_latest_ohlcv_timestamp", n,
+         lambda i: simple_data.get_latest_ohlcv_timestamp(tickers[i % len(tickers)]) and 1, None),
+        ("get_ohlcv_data_many", max(n // 10, 1),
+         lambda i: len(simple_data.get_ohlcv_data_many(tickers, START_DATE, END_DATE)), None),
+        ("get_latest_ohlcv_timestamps", n, lambda i: len(simple_data.get_latest_ohlcv_timestamps()), None),
+        # 보관기간 정리 / 내보내기
+        ("delete_old_ohlcv_data", max(n // 20, 1), lambda i: simple_data.delete_old_ohlcv_data(2), add_old_rows),
+        ("purge_old_data", max(n // 20, 1), purge, add_old_rows),
+        ("export_ohlcv_snapshot", max(n // 50, 1), export, None),
+    ]
+
+
+def buffered_cases(simple_data, args):
+    """ 쓰기 버퍼를 켠 별도 인스턴스에서 측정하는 항목 (add_string 경로가 달라짐) """
+    messages = make_messages(args.batch)
+    simple_data.enable_write_buffer(max_items=500, flush_interval=0.5)
+
+    def fill_buffer(i):
+        for message in messages:
+            simple_data.add_string(TableType.Msg, message)
+
+    return [
+        ("add_string[buffered]", args.iterations,
+         lambda i: simple_data.add_string(TableType.Msg, messages[i % args.batch]) or 1, None),
+        ("flush_writes", max(args.iterations // 10, 1), lambda i: simple_data.flush_writes() or args.batch,
+         fill_buffer),
+    ]
+
+
+def replica_cases(simple_data, tickers, args):
+    """ 읽기 전용 사본을 켠 별도 인스턴스에서 측정하는 항목 (자동 갱신은 측정 중 일어나지 않도록 길게 설정) """
+    simple_data.enable_replica(max_lag=3600)
+    return [
+        ("refresh_replica", max(args.iterations // 20, 1), lambda i: simple_data.refresh_replica() and None, None),
+        ("get_ohlcv_data[replica]", args.iterations,
+         lambda i: len(simple_data.get_ohlcv_data(tickers[i % len(tickers)], START_DATE, END_DATE)), None),
+    ]
+
+
+def covered_methods(names):
+    """ 측정 항목에서 빠진 계측 대상(@_instrumented) SimpleData 공개 메서드 목록 반환 """
+    measured = {name.split("[")[0] for name in names}
+    public = {name for name, member in vars(SimpleData).items()
+              if not name.startswith("_") and hasattr(member, "__wrapped__")}
+    return sorted(public - measured)
+
+
+def run_single_process(args, tmp_dir, results):
+    uncovered = set()
+    for pooled in (False, True):
+        mode = "pooled" if pooled else "plain"
+        db_path = os.path.join(tmp_dir, f"single-{mode}.db")
+        tickers = seed_database(db_path, args.tickers, args.rows, args.iterations * args.batch,
+                                make_common_records(args.common_rows))
+
+        # 사본 측정은 보관기간 정리(purge) 항목이 OHLCV 데이터를 지우기 전에 실행
+        with SimpleData(db_path, pooled=pooled) as simple_data:
+            replica = replica_cases(simple_data, tickers, args)
+            run_cases("single", mode, replica, results)
+        with SimpleData(db_path, pooled=pooled) as simple_data:
+            cases = single_process_cases(simple_data, tickers, args, tmp_dir)
+            run_cases("single", mode, cases, results)
+        with SimpleData(db_path, pooled=pooled) as simple_data:
+            buffered = buffered_cases(simple_data, args)
+            run_cases("single", mode, buffered, results)
+
+        uncovered.update(covered_methods(name for name, *_ in cases + buffered + replica))
+    return sorted(uncovered)
+
+
+def run_cases(suite, mode, cases, results):
+    for name, iterations, call, setup in cases:
+        latencies, rows, errors = measure(call, iterations, setup)
+        results.append(report(summarize(suite, name, mode, latencies, rows, errors=errors)))
+
+
+def contention_worker(db_path, pooled, worker, operations, batch, tickers, start_at):
+    """ 다른 워커와 동시에 MIXED_WORKLOAD를 번갈아 실행하고 {작업: [지연 시간]}을 반환 (프로세스에서 실행) """
+    messages = make_messages(batch, prefix=f"worker{worker}")
+    records = make_common_records(operations, seed=worker)
+    frame = make_ohlcv_frame(batch * operations, start=datetime.datetime(2030, 1, 1), seed=worker)
+    ticker = f"KRW-W{worker:03d}"
+    day = datetime.datetime(2024, 1, 1)
+
+    calls = {
+        "add_strings": lambda i, data: data.add_strings(TableType.Msg, messages),
+        "pop_strings": lambda i, data: data.pop_strings(TableType.Msg, limit=batch),
+        "insert_ohlcv_data": lambda i, data: data.insert_ohlcv_data(ticker, frame.iloc[i * batch:(i + 1) * batch]),
+        "get_ohlcv_data": lambda i, data: data.get_ohlcv_data(tickers[i % len(tickers)], START_DATE, END_DATE),
+        "insert_common_data": lambda i, data: data.insert_common_data(*records[i]),
+        "get_common_data_between_dates": lambda i, data: data.get_common_data_between_dates(
+            "metric", day, day + datetime.timedelta(days=7)),
+        "get_latest_ohlcv_timestamps": lambda i, data: data.get_latest_ohlcv_timestamps(),
+    }
+
+    latencies = {name: [] for name in MIXED_WORKLOAD}
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output), SimpleData(db_path, pooled=pooled) as simple_data:
+        time.sleep(max(start_at - time.time(), 0))  # 모든 워커가 같은 시각에 시작
+        started = time.time()
+        for i in range(operations):
+            name = MIXED_WORKLOAD[(i + worker) % len(MIXED_WORKLOAD)]
+            call_started = time.perf_counter()
+            calls[name](i, simple_data)
+            latencies[name].append(time.perf_counter() - call_started)
+        finished = time.time()
+
+    return latencies, started, finished, output.getvalue().count("error occurred")
+
+
+def run_contention(args, tmp_dir, results):
+    for pooled in (False, True):
+        mode = "pooled" if pooled else "plain"
+        for processes in args.processes:
+            db_path = os.path.join(tmp_dir, f"contention-{mode}-{processes}.db")
+            tickers = seed_database(db_path, args.tickers, args.rows, 0, make_common_records(args.common_rows))
+            if pooled:
+                # WAL 모드 전환은 DB 파일에 남으므로 워커 시작 전에 한 번 적용
+                SimpleData(db_path, pooled=True).close()
+
+            start_at = time.time() + 1.0
+            with ProcessPoolExecutor(max_workers=processes) as executor:
+                futures = [executor.submit(contention_worker, db_path, pooled, worker, args.contention_ops,
+                                           args.batch, tickers, start_at)
+                           for worker in range(processes)]
+                outcomes = [future.result() for future in futures]
+
+            wall = max(finished for _, _, finished, _ in outcomes) - min(started for _, started, _, _ in outcomes)
+            label = f"{mode} x{processes}"
+            merged = {name: [] for name in MIXED_WORKLOAD}
+            for latencies, *_ in outcomes:
+                for name, values in latencies.items():
+                    merged[name].extend(values)
+
+            for name, values in merged.items():
+                results.append(report(summarize("contention", name, label, values)))
+            all_latencies = [value for values in merged.values() for value in values]
+            errors = sum(error_count for *_, error_count in outcomes)
+            results.append(report(summarize("contention", "mixed", label, all_latencies, seconds=wall,
+                                            errors=errors)))
+
+
+def run_logger(args, tmp_dir, results):
+    """ SimpleLogger.log 호출 처리량 (파일 + 콘솔 핸들러, 콘솔 출력은 /dev/null) """
+    for mode in ("sync", "async"):
+        with open(os.devnull, "w") as devnull:
+            with contextlib.redirect_stderr(devnull):
+                simple_logger = SimpleLogger(name=f"bench-suite-{mode}", log_file=os.path.join(tmp_dir, f"{mode}.log"),
+                                             async_mode=mode == "async")
+
+            cases = [
+                ("log[info]", lambda i: simple_logger.log("order filled #%d", logging.INFO, i) or 1),
+                ("log[debug-filtered]", lambda i: simple_logger.log("order book #%d", logging.DEBUG, i) or 1),
+                ("log[error]", lambda i: simple_logger.log("order rejected #%d", logging.ERROR, i) or 1),
+            ]
+            try:
+                for name, call in cases:
+                    latencies, rows, errors = measure(call, args.log_iterations)
+                    results.append(report(summarize("logger", name, mode, latencies, rows, errors=errors)))
+            finally:
+                simple_logger.close()
+
+
+def report(result):
+    rows_per_sec = f"{result['rows_per_sec']:>14,.0f} rows/s" if result["rows_per_sec"] else " " * 21
+    print(f"{result['suite']:<11} {result['name']:<32} {result['mode']:<11} {result['calls']:>7} calls "
+          f"{result['ops_per_sec']:>12,.0f} ops/s {rows_per_sec} "
+          f"p50 {result['p50_ms']:>9.3f}ms p99 {result['p99_ms']:>9.3f}ms"
+          + (f"  ({result['errors']} errors)" if result["errors"] else ""))
+    return result
+
+
+def environment():
+    """ 결과 비교 시 함께 기록할 실행 환경 정보 """
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], cwd=ROOT_DIR, capture_output=True, text=True,
+                                check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%d %H:%M:%S"),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "sqlite": sqlite3.sqlite_version,
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+    }
+
+
+def compare(results, baseline_path, tolerance):
+    """ 기준 결과(JSON)보다 ops/s가 tolerance 이상 낮거나 p99가 tolerance 이상 높은 항목 목록 반환 """
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {(r["suite"], r["name"], r["mode"]): r for r in json.load(f)["results"]}
+
+    regressions = []
+    for result in results:
+        base = baseline.get((result["suite"], result["name"], result["mode"]))
+        if base is None:
+            continue
+        if base["ops_per_sec"] and result["ops_per_sec"] < base["ops_per_sec"] * (1 - tolerance):
+            regressions.append((result, "ops_per_sec", base["ops_per_sec"], result["ops_per_sec"]))
+        if base["p99_ms"] and result["p99_ms"] > base["p99_ms"] * (1 + tolerance):
+            regressions.append((result, "p99_ms", base["p99_ms"], result["p99_ms"]))
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SimpleData / SimpleLogger 오프라인 벤치마크 (합성 데이터)")
+    parser.add_argument("--iterations", type=int, default=200, help="메서드별 반복 횟수 (무거운 메서드는 1/10~1/50)")
+    parser.add_argument("--batch", type=int, default=100, help="add_strings / pop_strings / OHLCV 삽입당 행 수")
+    parser.add_argument("--tickers", type=int, default=8)
+    parser.add_argument("--rows", type=int, default=5000, help="티커당 초기 OHLCV 행 수")
+    parser.add_argument("--common-rows", type=int, default=20000, help="초기 common_data 행 수")
+    parser.add_argument("--processes", type=lambda text: [int(p) for p in text.split(",")], default=[1, 2, 4],
+                        help="경합 측정 프로세스 수 목록 (예: 1,2,4)")
+    parser.add_argument("--contention-ops", type=int, default=140, help="경합 측정에서 워커당 작업 수")
+    parser.add_argument("--log-iterations", type=int, default=20000)
+    parser.add_argument("--suites", default="single,contention,logger")
+    parser.add_argument("--output", help="결과를 JSON 파일로 저장")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON (회귀가 있으면 종료 코드 1)")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="회귀로 판단할 상대 변화율")
+    args = parser.parse_args()
+
+    suites = args.suites.split(",")
+    results = []
+    uncovered = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        if "single" in suites:
+            uncovered = run_single_process(args, tmp_dir, results)
+        if "contention" in suites:
+            run_contention(args, tmp_dir, results)
+        if "logger" in suites:
+            run_logger(args, tmp_dir, results)
+
+    if uncovered:
+        print(f"⚠️ SimpleData methods without a benchmark case: {', '.join(uncovered)}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"environment": environment(), "parameters": vars(args), "uncovered": uncovered,
+                       "results": results}, f, indent=2)
+        print(f"results written to {args.output}")
+
+    if args.baseline:
+        regressions = compare(results, args.baseline, args.tolerance)
+        for result, metric, before, after in regressions:
+            print(f"❌ regression: {result['suite']}/{result['name']} [{result['mode']}] "
+                  f"{metric} {before:,.3f} -> {after:,.3f}")
+        if regressions:
+            sys.exit(1)
+        print(f"✅ no regressions beyond {args.tolerance:.0%} against {args.baseline}")
@@ -0,0 +1,87 @@
+import contextlib
+import datetime
+import io
+import os
+import sys
+import tempfile
+
+from synthetic import make_ohlcv_frames
+from simpledata import SimpleData, TableType
+
+# 테이블 전체 스캔 없이 인덱스로 처리되어야 하는 자주 쓰는 조회/삭제
+NOW = datetime.datetime(2023, 1, 3)
+HOT_CALLS = [
+    ("get_common_data", ("config", NOW)),
+    ("get_common_data_between_dates", ("config", NOW - datetime.timedelta(days=1), NOW)),
+    ("update_common_data", (1, "a", "b", "c", "d", 1.0, 2.0, 3.0, 4.0, NOW)),
+    ("delete_common_data_by_id", (1,)),
+    ("delete_common_data", (10,)),
+    ("get_ohlcv_data", ("KRW-T000", NOW - datetime.timedelta(days=1), NOW)),
+    ("get_ohlcv_data_many", (["KRW-T000", "KRW-T001"], NOW - datetime.timedelta(days=1), NOW)),
+    ("get_latest_ohlcv_timestamp", ("KRW-T000",)),
+    ("get_latest_ohlcv_timestamps", (["KRW-T000", "KRW-T001"],)),
+    ("delete_old_ohlcv_data", (2, 1000)),
+    ("delete_common_data", (10, 1000)),
+    ("delete_ohlcv_by_ticker", ("KRW-T001",)),
+]
+
+
+def collect_statements(simple_data, conn, method, args):
+    """ 메서드 실행 중 실제로 실행된 SELECT/UPDATE/DELETE 문을 수집 """
+    statements = []
+    conn.set_trace_callback(statements.append)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            result = getattr(simple_data, method)(*args)
+            if hasattr(result, "__next__"):
+                list(result)
+    finally:
+        conn.set_trace_callback(None)
+
+    return [sql for sql in statements if sql.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE"))]
+
+
+def table_scans(conn, sql):
+    """ EXPLAIN QUERY PLAN 결과 중 테이블 스캔(SCAN, 커버링 인덱스 제외) 항목 반환
+
+    sqlite_master(스키마 카탈로그)는 인덱스가 없고 schema_version이 바뀔 때만 읽으므로 제외한다.
+    """
+    plan = conn.execute(f"EXPLAIN QUERY PLAN {sql}").fetchall()
+    return [row[3] for row in plan
+            if row[3].startswith("SCAN") and "INDEX" not in row[3] and row[3] != "SCAN sqlite_master"]
+
+
+if __name__ == "__main__":
+    failures = []
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # 풀 모드에서는 같은 스레드가 같은 연결을 쓰므로 trace callback으로 SQL을 수집할 수 있음
+        with SimpleData(os.path.join(tmp_dir, "plans.db"), pooled=True) as simple_data:
+            conn = simple_data._connect()
+            with contextlib.redirect_stdout(io.StringIO()):
+                simple_data.insert_ohlcv_data_many(make_ohlcv_frames(2, 300))
+                simple_data.add_string(TableType.Msg, "message")
+
+            # 여러 type / 날짜에 걸친 common_data를 채운 뒤 통계 갱신
+            conn.executemany('''
+                INSERT INTO common_data (type, value1, value2, value3, value4, number1, number2, number3, number4, date)
+                VALUES (?, 'a', 'b', 'c', 'd', 1.0, 2.0, 3.0, 4.0, ?)
+            ''', [
+                (f"type{i % 20}", (NOW - datetime.timedelta(hours=i)).strftime("%Y-%m-%d %H:%M:%S"))
+                for i in range(5000)
+            ])
+            conn.commit()
+            conn.execute("ANALYZE")
+
+            for method, args in HOT_CALLS:
+                for sql in collect_statements(simple_data, conn, method, args):
+                    scans = table_scans(conn, sql)
+                    status = "SCAN" if scans else "ok"
+                    print(f"[{status:>4}] {method}: {' '.join(sql.split())[:100]}")
+                    if scans:
+                        failures.append((method, scans))
+
+    if failures:
+        print(f"\n❌ {len(failures)} hot query(s) fall back to a table scan: {failures}")
+        sys.exit(1)
+    print("\n✅ All hot queries use an index.")
@@ -0,0 +1,73 @@
+import contextlib
+import datetime
+import io
+import os
+import sqlite3
+import sys
+import tempfile
+
+from synthetic import create_legacy_ohlcv_table, make_ohlcv_frame
+from simpledata import SimpleData
+
+# 사본으로만 조회하는 인스턴스가 다른 인스턴스의 스키마 변경(마이그레이션 / 롤업 생성)을 사본 갱신 후 감지하는지 확인
+START = datetime.datetime(1900, 1, 1)
+END = datetime.datetime(2100, 1, 1)
+ROWS = 100
+
+
+def check(failures, name, ok, detail):
+    print(f"[{'ok' if ok else 'FAIL':>4}] {name}: {detail}")
+    if not ok:
+        failures.append(name)
+
+
+if __name__ == "__main__":
+    failures = []
+
+    with tempfile.TemporaryDirectory() as tmp_dir, contextlib.redirect_stdout(io.StringIO()):
+        db_path = os.path.join(tmp_dir, "replica.db")
+        conn = sqlite3.connect(db_path)
+        create_legacy_ohlcv_table(conn)
+        conn.commit()
+        conn.close()
+
+        writer = SimpleData(db_path)
+        writer.insert_ohlcv_data("KRW-BTC", make_ohlcv_frame(ROWS))
+
+        # 갱신 주기를 길게 두고 refresh_replica를 직접 호출 (조회는 항상 사본에서)
+        reader = SimpleData(db_path)
+        reader.enable_replica(max_lag=600)
+        before = len(reader.get_ohlcv_data("KRW-BTC", START, END))
+
+        # 다른 인스턴스의 TEXT → epoch 마이그레이션
+        writer.migrate_ohlcv_to_epoch(vacuum=False)
+        reader.refresh_replica()
+        rows = len(reader.get_ohlcv_data("KRW-BTC", START, END))
+        latest = reader.get_latest_ohlcv_timestamp("KRW-BTC")
+
+        # 다른 인스턴스의 롤업 생성 (생성 전 조회로 "롤업 없음"이 캐시된 상태에서)
+        try:
+            reader.get_ohlcv_data("KRW-BTC", START, END, interval="1h")
+            missing = False
+        except ValueError:
+            missing = True
+        writer.enable_rollups(["1h"])
+        reader.refresh_replica()
+        try:
+            bars = len(reader.get_ohlcv_data("KRW-BTC", START, END, interval="1h"))
+        except ValueError as e:
+            bars = e
+
+        reader.close()
+        writer.close()
+
+    check(failures, "rows before migration", before == ROWS, f"{before} rows")
+    check(failures, "rows after migration", rows == ROWS, f"{rows} rows")
+    check(failures, "latest timestamp after migration", isinstance(latest, str), repr(latest))
+    check(failures, "rollup missing before enable_rollups", missing, "ValueError" if missing else "rows returned")
+    check(failures, "rollup after enable_rollups", isinstance(bars, int) and bars > 0, repr(bars))
+
+    if failures:
+        print(f"\n❌ {len(failures)} replica schema check(s) failed: {failures}")
+        sys.exit(1)
+    print("\n✅ Replica reads follow schema changes made by other instances.")
@@ -0,0 +1,78 @@
+import datetime
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+# 저장소 루트의 simpledata / Logging 모듈을 import 할 수 있도록 경로 추가
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+
+def create_legacy_ohlcv_table(conn):
+    """ TEXT timestamp를 쓰던 기존 형식의 OHLCV 테이블 생성 (비교/마이그레이션 검증용) """
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS table_ohlcv_data (
+            ticker TEXT NOT NULL,
+            timestamp TEXT NOT NULL,
+            open REAL,
+            high REAL,
+            low REAL,
+            close REAL,
+            volume REAL,
+            value REAL,
+            price_change REAL,
+            PRIMARY KEY (ticker, timestamp)
+        )
+    ''')
+
+
+def make_ohlcv_frame(rows, start=None, freq="15min", seed=0):
+    """ pyupbit get_ohlcv 결과와 같은 형태의 합성 OHLCV DataFrame을 만드는 함수 """
+    rng = np.random.default_rng(seed)
+    if start is None:
+        start = datetime.datetime(2023, 1, 1)
+
+    index = pd.date_range(start=start, periods=rows, freq=freq)
+    close = 50_000_000 * np.exp(np.cumsum(rng.normal(0, 0.002, rows)))
+    open_ = np.concatenate(([close[0]], close[:-1]))
+    spread = np.abs(rng.normal(0, 0.001, rows)) * close
+    volume = rng.gamma(2.0, 5.0, rows)
+
+    return pd.DataFrame({
+        "open": open_,
+        "high": np.maximum(open_, close) + spread,
+        "low": np.minimum(open_, close) - spread,
+        "close": close,
+        "volume": volume,
+        "value": volume * close,
+    }, index=index)
+
+
+def make_ohlcv_frames(tickers, rows, start=None, freq="15min"):
+    """ 여러 티커의 합성 OHLCV DataFrame을 {ticker: DataFrame} 형태로 만드는 함수 """
+    return {
+        f"KRW-T{i:03d}": make_ohlcv_frame(rows, start=start, freq=freq, seed=i)
+        for i in range(tickers)
+    }
+
+
+def make_common_records(count, types=("metric", "signal", "balance"), start=None, seed=0):
+    """ insert_common_data 인자 순서와 같은 (type, value1..4, number1..4, date) 튜플 목록을 만드는 함수 """
+    rng = np.random.default_rng(seed)
+    if start is None:
+        start = datetime.datetime(2024, 1, 1)
+
+    numbers = rng.normal(100.0, 15.0, (count, 4))
+    return [
+        (types[i % len(types)], f"KRW-T{i % 50:03d}", "buy" if i % 2 else "sell", f"tag{i % 7}", None,
+         *numbers[i].tolist(), start + datetime.timedelta(minutes=i))
+        for i in range(count)
+    ]
+
+
+def make_messages(count, prefix="alert message"):
+    """ 문자열 큐(add_string / pop_strings)용 합성 메시지 목록 """
+    return [f"{prefix} #{i}: price crossed threshold" for i in range(count)]
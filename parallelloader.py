@@ -0,0 +1,126 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+import pandas as pd
+
+from simpledata import DEFAULT_CHUNK_SIZE, OHLCV_COLUMNS, SimpleData
+
+# 공유 메모리 블록에 담는 컬럼 (ticker는 부모가 다시 채움, timestamp는 int64 ns로 저장)
+_SHARED_COLUMNS = OHLCV_COLUMNS[1:]
+
+def _unlink_blocks(results):
+    """ (ticker, 블록 이름, 행 수) 목록의 공유 메모리 블록을 해제 """
+    for ticker, shm_name, row_count in results:
+        if shm_name is None:
+            continue
+        try:
+            shm = shared_memory.SharedMemory(name=shm_name)
+        except FileNotFoundError:
+            continue
+        shm.close()
+        shm.unlink()
+
+def _load_shard(db_path, tickers, start_date, end_date, interval, chunk_size):
+    """ 워커 프로세스: 읽기 전용 연결로 티커들을 읽어 공유 메모리에 컬럼 단위로 기록 """
+    simple_data = SimpleData(db_path, read_only=True)
+    results = []
+
+    try:
+        for ticker in tickers:
+            # 첫 값은 같은 읽기 트랜잭션의 COUNT → 블록을 미리 할당하고 chunk를 바로 채움
+            chunks = simple_data.iter_ohlcv_data(ticker, start_date, end_date, chunk_size, interval, with_count=True)
+            row_count = next(chunks, 0)
+            if row_count == 0:
+                chunks.close()
+                results.append((ticker, None, 0))
+                continue
+
+            # (컬럼 수, 행 수) 8바이트 배열 하나로 기록 → 부모는 pickle 없이 이름만 받아 매핑
+            shm = shared_memory.SharedMemory(create=True, size=len(_SHARED_COLUMNS) * row_count * 8)
+            # 블록 해제(unlink)는 부모가 담당하므로 워커의 resource tracker 등록은 해제 (오류 시에는 아래에서 직접 해제)
+            resource_tracker.unregister(shm._name, "shared_memory")
+            results.append((ticker, shm.name, row_count))
+
+            block = np.ndarray((len(_SHARED_COLUMNS), row_count), dtype="float64", buffer=shm.buf)
+            offset = 0
+            for chunk in chunks:
+                end = offset + len(chunk)
+                block[0, offset:end].view("int64")[:] = chunk["timestamp"].to_numpy(dtype="datetime64[ns]").view("int64")
+                for index, name in enumerate(_SHARED_COLUMNS[1:], start=1):
+                    block[index, offset:end] = chunk[name].to_numpy()
+                offset = end
+            del block
+            shm.close()
+
+            if offset != row_count:
+                raise RuntimeError(f"{ticker}: read {offset} of {row_count} OHLCV rows")
+
+    except BaseException:
+        # 부모에 전달되지 않는 블록은 워커가 직접 해제
+        _unlink_blocks(results)
+        raise
+
+    finally:
+        simple_data.close()
+
+    return results
+
+def _frame_from_shared(ticker, shm_name, row_count):
+    """ 부모 프로세스: 공유 메모리 블록을 DataFrame으로 복사한 뒤 블록을 해제 """
+    if shm_name is None:
+        dtypes = dict.fromkeys(OHLCV_COLUMNS, "float64")
+        dtypes.update(ticker=object, timestamp="datetime64[ns]")
+        return pd.DataFrame({name: np.array([], dtype=dtype) for name, dtype in dtypes.items()})
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        block = np.ndarray((len(_SHARED_COLUMNS), row_count), dtype="float64", buffer=shm.buf)
+        data = {"ticker": np.full(row_count, ticker, dtype=object),
+                "timestamp": block[0].view("int64").astype("datetime64[ns]")}
+        for index, name in enumerate(_SHARED_COLUMNS[1:], start=1):
+            data[name] = block[index].copy()
+        del block
+        return pd.DataFrame(data, copy=False)
+    finally:
+        shm.close()
+        shm.unlink()
+
+def load_ohlcv_parallel(db_path, tickers, start_date, end_date, processes=None, interval=None,
+                        chunk_size=DEFAULT_CHUNK_SIZE):
+    """ 티커 목록을 프로세스 풀에 나눠 읽고 {ticker: DataFrame}으로 반환하는 함수
+
+    각 워커는 mode=ro 읽기 전용 연결을 사용하고, 결과는 pickle 대신 공유 메모리로 전달한다.
+    반환되는 DataFrame은 iter_ohlcv_data와 같은 타입(datetime64 / float64)이다.
+    """
+    tickers = list(tickers)
+    processes = processes or os.cpu_count() or 1
+    processes = max(1, min(processes, len(tickers)))
+    shards = [tickers[index::processes] for index in range(processes)]
+    frames = {}
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        futures = [executor.submit(_load_shard, db_path, shard, start_date, end_date, interval, chunk_size)
+                   for shard in shards if shard]
+        # 한 워커가 실패해도 다른 워커가 만든 블록을 해제할 수 있도록 모든 결과를 먼저 모음
+        pending = []
+        error = None
+        for future in futures:
+            try:
+                pending.extend(future.result())
+            except Exception as e:
+                error = error or e
+        if error is not None:
+            _unlink_blocks(pending)
+            raise error
+
+        try:
+            while pending:
+                ticker, shm_name, row_count = pending.pop(0)
+                frames[ticker] = _frame_from_shared(ticker, shm_name, row_count)
+        finally:
+            # 오류로 중단되면 아직 읽지 않은 블록도 해제
+            _unlink_blocks(pending)
+
+    return {ticker: frames[ticker] for ticker in tickers}
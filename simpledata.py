@@ -1,7 +1,88 @@
+import atexit
+import bisect
 import datetime
+import functools
+import importlib
+import itertools
+import json
+import os
+import pathlib
 import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
 from enum import Enum
-import pandas as pd
+
+class _LazyModule:
+    """ 첫 속성 접근 때 모듈을 import하는 프록시 (문자열 큐 / common_data만 쓰는 프로세스는 pandas를 로드하지 않음)
+
+    로드한 뒤에는 모듈 전역 이름(alias)을 실제 모듈로 바꿔 이후 접근에는 프록시 비용이 없다.
+    """
+    def __init__(self, name, alias):
+        self._name = name
+        self._alias = alias
+
+    def __getattr__(self, attr):
+        module = importlib.import_module(self._name)
+        globals()[self._alias] = module
+        return getattr(module, attr)
+
+np = _LazyModule("numpy", "np")
+pd = _LazyModule("pandas", "pd")
+
+def _is_dataframe(value):
+    """ pandas를 import하지 않고 DataFrame 여부 확인 (pandas가 로드되지 않았다면 DataFrame일 수 없음) """
+    pandas = sys.modules.get("pandas")
+    return pandas is not None and isinstance(value, pandas.DataFrame)
+
+# 함수 코드 객체의 제너레이터 플래그 (inspect.CO_GENERATOR, inspect import 비용을 피하기 위해 직접 정의)
+_CO_GENERATOR = 0x20
+
+# OHLCV 테이블 컬럼 정의
+OHLCV_COLUMNS = ["ticker", "timestamp", "open", "high", "low", "close", "volume", "value", "price_change"]
+
+# common_data 테이블 컬럼 (SELECT * 순서)
+COMMON_DATA_COLUMNS = ["id", "type", "value1", "value2", "value3", "value4",
+                       "number1", "number2", "number3", "number4", "date"]
+
+# executemany 한 번에 넘기는 기본 행 수
+DEFAULT_CHUNK_SIZE = 5000
+
+# OHLCVCache에서 "캐시 없음"과 None 값을 구분하기 위한 표식
+_MISSING = object()
+
+# OHLCV timestamp 저장 형식: 벽시계 기준 epoch 밀리초 (tzinfo는 무시)
+_EPOCH = datetime.datetime(1970, 1, 1)
+_ONE_MS = datetime.timedelta(milliseconds=1)
+
+# epoch 밀리초 → 'YYYY-MM-DD HH:MM:SS' 문자열 변환 SQL (기존 TEXT 형식과 같은 출력)
+_EPOCH_MS_AS_TEXT = "strftime('%Y-%m-%d %H:%M:%S', {column} / 1000, 'unixepoch')"
+
+# 기존 TEXT timestamp → epoch 밀리초 변환 SQL (마이크로초/타임존 접미사는 버림)
+_TEXT_AS_EPOCH_MS = "CAST(ROUND((julianday(substr({column}, 1, 19)) - 2440587.5) * 86400000) AS INTEGER)"
+
+# 롤업(집계) 테이블로 유지할 수 있는 봉 간격 (epoch 밀리초 단위 버킷 크기)
+ROLLUP_INTERVALS = {
+    "1h": 60 * 60 * 1000,
+    "4h": 4 * 60 * 60 * 1000,
+    "1d": 24 * 60 * 60 * 1000,
+}
+
+# OHLCV 스냅샷 디렉터리의 메타데이터 파일 이름
+SNAPSHOT_MANIFEST = "manifest.json"
+
+# IN (...) 절 하나에 바인딩하는 최대 파라미터 수 (SQLite 변수 개수 제한 대비)
+MAX_IN_PARAMS = 500
+
+# 읽기 전용 사본 backup 한 단계에서 복사하는 페이지 수 (단계 사이에 writer가 잠금을 얻을 수 있음)
+REPLICA_BACKUP_PAGES = 1024
+
+# 복사 중 원본이 바뀌어 backup이 처음부터 다시 시작되는 것을 허용하는 횟수 (넘으면 이번 갱신은 포기)
+REPLICA_BACKUP_RESTARTS = 3
+
+# 계측(enable_metrics) 지연 시간 히스토그램 버킷 상한 (초)
+METRIC_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
 
 # Enum 정의
 class TableType(Enum):
@@ -9,20 +90,747 @@ class TableType(Enum):
     Check = "table_check"
     OHLCV = "table_ohlcv_data"  # OHLCV 데이터 저장 테이블 추가
 
+# 풀 모드에서 연결마다 적용하는 기본 PRAGMA
+DEFAULT_PRAGMAS = {
+    "auto_vacuum": "INCREMENTAL",  # 새 DB 파일에만 적용되므로 journal_mode보다 먼저 설정 (기존 DB는 enable_incremental_vacuum 사용)
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "cache_size": -16000,  # 음수는 KiB 단위 (약 16MB)
+    "mmap_size": 0,
+}
+
+def _to_epoch_ms(value):
+    """ datetime을 벽시계 기준 epoch 밀리초로 변환 (tz-aware인 경우 tzinfo만 제거) """
+    return (value.replace(tzinfo=None) - _EPOCH) // _ONE_MS
+
+def _connect_sqlite(db_path, timeout, read_only=False, **kwargs):
+    """ sqlite3 연결 생성 (read_only=True면 mode=ro URI로 열어 쓰기/스키마 변경 불가) """
+    if read_only:
+        uri = pathlib.Path(db_path).resolve().as_uri() + "?mode=ro"
+        return sqlite3.connect(uri, timeout=timeout, uri=True, **kwargs)
+    return sqlite3.connect(db_path, timeout=timeout, **kwargs)
+
+class _BackupRestarted(Exception):
+    """ 복사 중 원본 변경으로 backup이 너무 자주 다시 시작되어 중단했음을 알리는 내부 예외 """
+
+class _ReplicaConnection(sqlite3.Connection):
+    """ 읽기 전용 사본 연결 (어느 세대의 사본 파일을 열었는지 generation에 기록) """
+    generation = None
+
+class ConnectionPool:
+    """ 스레드별 sqlite3 연결을 재사용하는 연결 풀
+
+    연결은 만든 스레드가 끝나면 다음 연결 생성 시 정리하므로 짧게 사는 스레드가 많아도 연결이 쌓이지 않는다.
+    """
+    def __init__(self, db_path, timeout=10, pragmas=None, read_only=False):
+        self.db_path = db_path
+        self.timeout = timeout
+        self.read_only = read_only
+        self.pragmas = dict(DEFAULT_PRAGMAS)
+        if pragmas:
+            self.pragmas.update(pragmas)
+        if read_only:
+            # 읽기 전용 연결에서는 auto_vacuum / journal_mode를 바꿀 수 없음
+            self.pragmas.pop("auto_vacuum", None)
+            self.pragmas.pop("journal_mode", None)
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections = {}  # 연결 -> 연결을 만든 스레드
+        self._closed = False
+
+    def acquire(self):
+        """ 현재 스레드의 연결을 반환 (없으면 새로 생성하고 PRAGMA 적용) """
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+
+        with self._lock:
+            if self._closed:
+                raise sqlite3.ProgrammingError("ConnectionPool is closed")
+
+            # 종료된 스레드의 연결 정리 (close()/정리 시 다른 스레드의 연결도 닫을 수 있도록 check_same_thread=False)
+            self._prune_dead_threads()
+            conn = _connect_sqlite(self.db_path, self.timeout, self.read_only, check_same_thread=False)
+            for name, value in self.pragmas.items():
+                conn.execute(f"PRAGMA {name}={value}")
+            self._connections[conn] = threading.current_thread()
+
+        self._local.conn = conn
+        return conn
+
+    def _prune_dead_threads(self):
+        """ 만든 스레드가 종료된 연결을 닫고 풀에서 제거 (self._lock을 잡은 상태로 호출) """
+        dead = [conn for conn, thread in self._connections.items() if not thread.is_alive()]
+        for conn in dead:
+            del self._connections[conn]
+            try:
+                conn.close()
+            except sqlite3.Error as e:
+                print(f"Database error occurred: {e}")
+
+    def close(self):
+        """ 풀에서 생성한 모든 연결을 닫는 메서드 """
+        with self._lock:
+            self._closed = True
+            connections, self._connections = list(self._connections), {}
+
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error as e:
+                print(f"Database error occurred: {e}")
+
+    def owns(self, conn):
+        """ conn이 현재 스레드에 할당된 풀 연결인지 여부 """
+        return getattr(self._local, "conn", None) is conn
+
+    def manages(self, conn):
+        """ conn이 (어느 스레드의 것이든) 이 풀이 만든 연결인지 여부 """
+        with self._lock:
+            return conn in self._connections
+
+    def stats(self):
+        """ 풀 상태 (열린 연결 수) 반환 """
+        with self._lock:
+            self._prune_dead_threads()
+            return {"connections": len(self._connections), "closed": self._closed}
+
+class StringWriteBuffer:
+    """ add_string 호출을 메모리에 모았다가 한 트랜잭션으로 저장하는 백그라운드 writer """
+    def __init__(self, simple_data, max_items=500, flush_interval=0.5):
+        self.simple_data = simple_data
+        self.max_items = max_items
+        self.flush_interval = flush_interval
+
+        self._pending = []  # (table_type, text_value)
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()  # flush 순서 보장 (메시지 id 순서 유지)
+        self._closed = False
+
+        self._thread = threading.Thread(target=self._run, name="StringWriteBuffer", daemon=True)
+        self._thread.start()
+
+        # 프로세스 종료 시 남은 메시지 저장
+        atexit.register(self.close)
+
+    def add(self, table_type, text_value):
+        """ 문자열을 버퍼에 추가 (max_items에 도달하면 writer를 깨움) """
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("StringWriteBuffer is closed")
+            self._pending.append((table_type, text_value))
+            if len(self._pending) >= self.max_items:
+                self._condition.notify()
+
+    def flush(self):
+        """ 버퍼의 문자열을 테이블별로 묶어 한 트랜잭션으로 저장 """
+        with self._flush_lock:
+            with self._condition:
+                pending, self._pending = self._pending, []
+            if not pending:
+                return
+
+            grouped = {}
+            for table_type, text_value in pending:
+                grouped.setdefault(table_type, []).append(text_value)
+
+            if not self.simple_data._add_strings_grouped(grouped):
+                # 저장 실패 시 다음 flush에서 다시 시도하도록 앞쪽에 되돌려 놓음
+                with self._condition:
+                    self._pending[:0] = pending
+
+    def _run(self):
+        while True:
+            with self._condition:
+                if not self._closed and len(self._pending) < self.max_items:
+                    self._condition.wait(self.flush_interval)
+                closed = self._closed
+            self.flush()
+            if closed:
+                return
+
+    def close(self):
+        """ writer 스레드를 멈추고 남은 문자열을 저장 """
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify()
+        self._thread.join()
+        self.flush()
+        atexit.unregister(self.close)
+
+class OHLCVCache:
+    """ OHLCV 범위 조회 결과 / 최신 timestamp를 보관하는 LRU + TTL 읽기 캐시 """
+    def __init__(self, max_entries=128, ttl=60.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_ttl = None  # 읽기 전용 사본 사용 중에는 max_lag로 제한 (사본에서 읽은 값이 그보다 오래 남지 않도록)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._entries = OrderedDict()  # key -> (만료 시각, 값)
+        self._lock = threading.Lock()
+        # 무효화 순서: 조회 전에 version()을 받아두고, 조회 중 해당 티커가 무효화됐으면 put을 건너뜀
+        self._version = 0  # invalidate마다 증가
+        self._invalidated = {}  # 티커(None: 전체) -> 마지막으로 무효화된 시점의 _version
+
+    def _get(self, key):
+        """ 만료되지 않은 값을 반환하고 LRU 순서를 갱신 (없으면 _MISSING) """
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        if entry[0] < time.monotonic():
+            del self._entries[key]
+            return _MISSING
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def _put(self, key, value):
+        ttl = self.ttl if self.max_ttl is None else min(self.ttl, self.max_ttl)
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def get_range(self, ticker, start_str, end_str, interval=None):
+        """ [start_str, end_str]를 포함하는 캐시 범위가 있으면 해당 구간만 잘라서 반환 """
+        with self._lock:
+            candidates = [key for key in self._entries
+                          if key[0] == "range" and key[1] == ticker and key[4] == interval
+                          and key[2] <= start_str and key[3] >= end_str]
+            for key in candidates:
+                df = self._get(key)
+                if df is _MISSING:
+                    continue
+                self.hits += 1
+                if key[2] == start_str and key[3] == end_str:
+                    return df.copy()
+                timestamps = df["timestamp"]
+                return df[(timestamps >= start_str) & (timestamps <= end_str)].reset_index(drop=True)
+
+            self.misses += 1
+            return None
+
+    def version(self):
+        """ 조회 전에 받아두는 무효화 버전 (put_range / put_latest의 version 인자로 전달) """
+        with self._lock:
+            return self._version
+
+    def _stale(self, ticker, version):
+        """ version을 받은 뒤 ticker(또는 전체)가 무효화되었는지 여부 """
+        if version is None:
+            return False
+        return max(self._invalidated.get(ticker, 0), self._invalidated.get(None, 0)) > version
+
+    def put_range(self, ticker, start_str, end_str, df, interval=None, version=None):
+        with self._lock:
+            if not self._stale(ticker, version):
+                self._put(("range", ticker, start_str, end_str, interval), df.copy())
+
+    def get_latest(self, ticker):
+        """ 캐시된 최신 timestamp 반환 (없으면 _MISSING) """
+        with self._lock:
+            value = self._get(("latest", ticker))
+            if value is _MISSING:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return value
+
+    def put_latest(self, ticker, value, version=None):
+        with self._lock:
+            if not self._stale(ticker, version):
+                self._put(("latest", ticker), value)
+
+    def invalidate(self, ticker=None):
+        """ 특정 티커(None이면 전체)의 캐시 항목 삭제 """
+        with self._lock:
+            self._version += 1
+            self._invalidated[ticker] = self._version
+            if ticker is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries if key[1] == ticker]:
+                del self._entries[key]
+
+    def stats(self):
+        """ 적중/실패/축출 카운터와 현재 항목 수 반환 """
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                    "entries": len(self._entries)}
+
+class RetentionWorker:
+    """ 주기적으로 purge_old_data를 실행하는 백그라운드 보관기간 정리 스레드 """
+    def __init__(self, simple_data, interval=3600.0, **purge_options):
+        self.simple_data = simple_data
+        self.interval = interval
+        self.purge_options = purge_options
+        self.last_report = None
+
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="RetentionWorker", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.last_report = self.simple_data.purge_old_data(stop_event=self._stop, **self.purge_options)
+            self._stop.wait(self.interval)
+
+    def stop(self):
+        """ 진행 중인 배치를 마친 뒤 스레드를 멈춤 """
+        self._stop.set()
+        self._thread.join()
+
+class ReplicaRefresher:
+    """ 주기적으로 refresh_replica를 실행하여 읽기 전용 사본을 갱신하는 백그라운드 스레드 """
+    def __init__(self, simple_data, interval=2.5):
+        self.simple_data = simple_data
+        self.interval = interval
+
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="ReplicaRefresher", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.simple_data.refresh_replica()
+
+    def stop(self):
+        """ 진행 중인 갱신을 마친 뒤 스레드를 멈춤 """
+        self._stop.set()
+        self._thread.join()
+
+class _Histogram:
+    """ Prometheus 방식(누적 버킷)으로 관측값을 모으는 히스토그램 """
+    __slots__ = ("counts", "count", "sum")
+
+    def __init__(self):
+        self.counts = [0] * (len(METRIC_BUCKETS) + 1)  # 마지막 칸은 +Inf
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect.bisect_left(METRIC_BUCKETS, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self):
+        buckets = {}
+        cumulative = 0
+        for bound, count in zip((*METRIC_BUCKETS, "+Inf"), self.counts):
+            cumulative += count
+            buckets[str(bound)] = cumulative
+        return {"count": self.count, "sum": self.sum, "buckets": buckets}
+
+class SimpleDataMetrics:
+    """ SimpleData 메서드별 지연 시간, 구간(잠금 대기/DataFrame 생성) 시간, 읽기/쓰기 행 수를 모으는 계측기
+
+    hook은 hook(kind, method, value) 형태의 콜러블로, 관측할 때마다 호출된다.
+    kind: "call"(초), "lock_wait"/"frame"(초), "rows_read"/"rows_written"(행 수)
+    """
+    def __init__(self, hooks=()):
+        self._lock = threading.Lock()
+        self._local = threading.local()  # 스레드별 현재 실행 중인 메서드 스택 / 연결별 변경 행 수 기준값
+        self._calls = {}  # method -> _Histogram
+        self._phases = {}  # (method, phase) -> _Histogram
+        self._rows = {}  # method -> [rows_read, rows_written]
+        self._errors = {}  # method -> 예외로 끝난 호출 수
+        self.hooks = list(hooks)
+
+    def add_hook(self, hook):
+        """ 관측값을 받을 hook(kind, method, value) 등록 """
+        self.hooks.append(hook)
+        return hook
+
+    def remove_hook(self, hook):
+        self.hooks.remove(hook)
+
+    def _emit(self, kind, method, value):
+        for hook in self.hooks:
+            try:
+                hook(kind, method, value)
+            except Exception as e:
+                print(f"❌ Metrics hook error: {e}")
+
+    def _stack(self):
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def enter(self, method):
+        """ 현재 스레드에서 method 실행 시작 (이후 구간/행 수는 이 메서드로 집계) """
+        self._stack().append(method)
+
+    def exit(self):
+        self._stack().pop()
+
+    def current_method(self):
+        stack = self._stack()
+        return stack[-1] if stack else None
+
+    def observe_call(self, method, seconds, failed=False):
+        with self._lock:
+            histogram = self._calls.get(method)
+            if histogram is None:
+                histogram = self._calls[method] = _Histogram()
+            histogram.observe(seconds)
+            if failed:
+                self._errors[method] = self._errors.get(method, 0) + 1
+        self._emit("call", method, seconds)
+
+    def observe_phase(self, phase, seconds):
+        """ 현재 메서드 안의 구간 시간 기록 (lock_wait: BEGIN IMMEDIATE 대기, frame: DataFrame 생성) """
+        method = self.current_method()
+        key = (method, phase)
+        with self._lock:
+            histogram = self._phases.get(key)
+            if histogram is None:
+                histogram = self._phases[key] = _Histogram()
+            histogram.observe(seconds)
+        self._emit(phase, method, seconds)
+
+    def add_rows(self, read=0, written=0):
+        """ 현재 메서드가 읽거나(fetch) 변경한(INSERT/UPDATE/DELETE) 행 수 누적 """
+        if not read and not written:
+            return
+        method = self.current_method()
+        with self._lock:
+            counts = self._rows.get(method)
+            if counts is None:
+                counts = self._rows[method] = [0, 0]
+            counts[0] += read
+            counts[1] += written
+        if read:
+            self._emit("rows_read", method, read)
+        if written:
+            self._emit("rows_written", method, written)
+
+    def connection_acquired(self, conn):
+        """ 연결의 누적 변경 행 수(total_changes)를 기준값으로 기억 (풀 연결은 중첩 사용 가능) """
+        baselines = getattr(self._local, "baselines", None)
+        if baselines is None:
+            baselines = self._local.baselines = {}
+        baselines.setdefault(id(conn), []).append(conn.total_changes)
+
+    def connection_released(self, conn):
+        """ 기준값 이후 변경된 행 수를 현재 메서드의 rows_written으로 기록 """
+        stack = getattr(self._local, "baselines", {}).get(id(conn))
+        if not stack:
+            return
+        written = conn.total_changes - stack.pop()
+        if stack:
+            # 바깥 호출이 안쪽 호출의 변경 행을 다시 세지 않도록 기준값을 옮김
+            stack[:] = [baseline + written for baseline in stack]
+        else:
+            del self._local.baselines[id(conn)]
+        self.add_rows(written=written)
+
+    def reset(self):
+        with self._lock:
+            self._calls.clear()
+            self._phases.clear()
+            self._rows.clear()
+            self._errors.clear()
+
+    def snapshot(self):
+        """ 지금까지 모은 값을 JSON으로 직렬화할 수 있는 dict로 반환 """
+        with self._lock:
+            calls = {method: dict(histogram.snapshot(), errors=self._errors.get(method, 0))
+                     for method, histogram in self._calls.items()}
+            phases = {}
+            for (method, phase), histogram in self._phases.items():
+                phases.setdefault(phase, {})[method or ""] = histogram.snapshot()
+            rows = {method or "": {"read": read, "written": written}
+                    for method, (read, written) in self._rows.items()}
+        return {"calls": calls, "phases": phases, "rows": rows}
+
+def _prometheus_histogram(lines, name, help_text, series):
+    """ {labels: histogram snapshot}를 Prometheus histogram 텍스트로 추가 """
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} histogram")
+    for labels, histogram in series:
+        label_text = ",".join(f'{key}="{value}"' for key, value in labels)
+        for bound, count in histogram["buckets"].items():
+            lines.append(f'{name}_bucket{{{label_text},le="{bound}"}} {count}')
+        lines.append(f"{name}_sum{{{label_text}}} {histogram['sum']}")
+        lines.append(f"{name}_count{{{label_text}}} {histogram['count']}")
+
+def format_metrics_prometheus(snapshot):
+    """ SimpleData.metrics_snapshot() 결과를 Prometheus text exposition 형식으로 변환 """
+    lines = []
+    calls = snapshot.get("calls", {})
+    _prometheus_histogram(lines, "simpledata_call_duration_seconds", "SimpleData method latency.",
+                          [([("method", method)], histogram) for method, histogram in sorted(calls.items())])
+
+    lines.append("# HELP simpledata_call_errors_total SimpleData calls that raised an exception.")
+    lines.append("# TYPE simpledata_call_errors_total counter")
+    for method, histogram in sorted(calls.items()):
+        lines.append(f'simpledata_call_errors_total{{method="{method}"}} {histogram["errors"]}')
+
+    phases = snapshot.get("phases", {})
+    _prometheus_histogram(lines, "simpledata_phase_duration_seconds",
+                          "Time spent in a phase (lock_wait, frame) inside a SimpleData method.",
+                          [([("method", method), ("phase", phase)], histogram)
+                           for phase, methods in sorted(phases.items())
+                           for method, histogram in sorted(methods.items())])
+
+    lines.append("# HELP simpledata_rows_total Rows fetched (read) or changed (written) by SimpleData methods.")
+    lines.append("# TYPE simpledata_rows_total counter")
+    for method, counts in sorted(snapshot.get("rows", {}).items()):
+        for direction in ("read", "written"):
+            lines.append(f'simpledata_rows_total{{method="{method}",direction="{direction}"}} {counts[direction]}')
+
+    cache = snapshot.get("cache")
+    if cache is not None:
+        for key in ("hits", "misses", "evictions"):
+            lines.append(f"# TYPE simpledata_ohlcv_cache_{key}_total counter")
+            lines.append(f"simpledata_ohlcv_cache_{key}_total {cache[key]}")
+        lines.append("# TYPE simpledata_ohlcv_cache_entries gauge")
+        lines.append(f"simpledata_ohlcv_cache_entries {cache['entries']}")
+
+    pool = snapshot.get("pool")
+    if pool is not None:
+        lines.append("# TYPE simpledata_pool_connections gauge")
+        lines.append(f"simpledata_pool_connections {pool['connections']}")
+
+    return "\n".join(lines) + "\n"
+
+def _instrumented(method):
+    """ 계측이 켜져 있을 때만 메서드 지연 시간을 기록하는 데코레이터 (꺼져 있으면 속성 확인 한 번) """
+    name = method.__name__
+
+    if method.__code__.co_flags & _CO_GENERATOR:
+        @functools.wraps(method)
+        def generator_wrapper(self, *args, **kwargs):
+            metrics = self._metrics
+            if metrics is None:
+                return (yield from method(self, *args, **kwargs))
+
+            # 소비자가 처리하는 시간은 빼고 next()로 다음 chunk를 만드는 시간만 합산
+            generator = method(self, *args, **kwargs)
+            elapsed = 0.0
+            failed = False
+            try:
+                while True:
+                    metrics.enter(name)
+                    start = time.perf_counter()
+                    try:
+                        item = next(generator)
+                    except StopIteration:
+                        return
+                    except BaseException:
+                        failed = True
+                        raise
+                    finally:
+                        elapsed += time.perf_counter() - start
+                        metrics.exit()
+                    yield item
+            finally:
+                generator.close()
+                metrics.observe_call(name, elapsed, failed)
+
+        return generator_wrapper
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        metrics = self._metrics
+        if metrics is None:
+            return method(self, *args, **kwargs)
+
+        metrics.enter(name)
+        start = time.perf_counter()
+        failed = True
+        try:
+            result = method(self, *args, **kwargs)
+            failed = False
+            return result
+        finally:
+            metrics.exit()
+            metrics.observe_call(name, time.perf_counter() - start, failed)
+
+    return wrapper
+
 class SimpleData:
-    def __init__(self, db_path='example.db'):
+    def __init__(self, db_path='example.db', pooled=False, pragmas=None, read_only=False):
         self.db_path = db_path
+        self.read_only = read_only
+        self._pool = None
+        self._schema_ready = read_only  # 읽기 전용이면 테이블 생성을 시도하지 않음
+        self._ohlcv_epoch = None  # (_schema_key, OHLCV timestamp가 epoch 형식인지) (None: 아직 확인 전)
+        self._write_buffer = None
+        self._ohlcv_cache = None
+        self._rollups = None  # (_schema_key, 이 DB에 존재하는 롤업 간격 목록) (None: 아직 확인 전)
+        self._retention = None
+        self._metrics = None  # enable_metrics로 켠 SimpleDataMetrics (None이면 계측 안 함)
+        self._replica = None  # enable_replica로 켠 ReplicaRefresher
+        self._replica_path = None
+        self._replica_max_lag = None
+        self._replica_pages = REPLICA_BACKUP_PAGES
+        self._replica_source = None  # backup 원본 연결 (data_version으로 원본 변경 여부 확인)
+        self._replica_data_version = None  # 마지막으로 복사한 시점의 원본 data_version
+        self._replica_refreshed_at = None  # 마지막 사본의 스냅샷 시각 (time.monotonic)
+        self._replica_generation = 0  # 사본 파일을 교체할 때마다 증가
+        self._replica_swap_lock = threading.Lock()  # 사본 파일 교체와 사본 연결 생성 사이의 순서 보장
+        self._replica_refresh_lock = threading.Lock()  # refresh_replica 직렬화 (갱신 스레드 / 호출 스레드가 같은 임시 파일 사용)
+
+        if pooled:
+            # 풀 모드: 스레드별 연결 재사용 + 스키마 생성은 풀당 한 번만 수행
+            self._pool = ConnectionPool(db_path, timeout=10, pragmas=pragmas, read_only=read_only)
+            if not read_only:
+                conn = self._pool.acquire()
+                self._create_schema(conn)
+                conn.commit()
+                self._schema_ready = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """ 쓰기 버퍼를 비우고 풀 모드에서 열어둔 연결들을 모두 닫는 메서드 """
+        self.stop_retention()
+        self.disable_replica()
+        if self._write_buffer is not None:
+            self._write_buffer.close()
+            self._write_buffer = None
+        if self._pool is not None:
+            self._pool.close()
+
+    def _connect(self, read=False):
+        """ 데이터베이스 연결을 관리하는 내부 메서드 (read=True면 사본이 충분히 최신일 때 사본 연결 반환) """
+        if read and self._replica_refreshed_at is not None \
+                and time.monotonic() - self._replica_refreshed_at <= self._replica_max_lag:
+            # 사본은 교체될 수 있으므로 풀에 두지 않고 호출마다 새로 열고 닫음
+            with self._replica_swap_lock:
+                conn = _connect_sqlite(self._replica_path, 10, read_only=True, factory=_ReplicaConnection)
+                conn.generation = self._replica_generation
+        elif self._pool is not None:
+            conn = self._pool.acquire()
+        else:
+            conn = _connect_sqlite(self.db_path, 10, self.read_only)
+        if self._metrics is not None:
+            self._metrics.connection_acquired(conn)
+        return conn
+
+    def _release(self, conn):
+        """ 연결 사용 종료: 풀 모드에서는 연결을 유지하고, 아니면 닫음 """
+        if self._metrics is not None:
+            self._metrics.connection_released(conn)
+        if self._pool is None or not self._pool.manages(conn):
+            conn.close()
+        elif not self._pool.owns(conn):
+            # 다른 스레드의 풀 연결은 그 스레드가 계속 쓰므로 닫거나 롤백하지 않음
+            print("❌ Pooled connection released from a thread that does not own it; leaving it open")
+        elif conn.in_transaction:
+            # 커밋되지 않은 트랜잭션이 다음 호출로 새지 않도록 롤백
+            conn.rollback()
 
-    def _connect(self):
-        """ 데이터베이스 연결을 관리하는 내부 메서드 """
-        return sqlite3.connect(self.db_path, timeout=10)
+    def _begin_immediate(self, conn):
+        """ BEGIN IMMEDIATE로 쓰기 잠금을 잡는 메서드 (계측 중이면 잠금 대기 시간을 lock_wait로 기록) """
+        if self._metrics is None:
+            conn.execute('BEGIN IMMEDIATE')
+            return
+        start = time.perf_counter()
+        conn.execute('BEGIN IMMEDIATE')
+        self._metrics.observe_phase("lock_wait", time.perf_counter() - start)
+
+    def _observe_phase(self, phase, start):
+        """ perf_counter 기준 start부터 지금까지를 현재 메서드의 phase 구간으로 기록 """
+        if self._metrics is not None:
+            self._metrics.observe_phase(phase, time.perf_counter() - start)
+
+    def _count_rows_read(self, count):
+        """ 계측 중이면 현재 메서드가 fetch한 행 수 누적 """
+        if self._metrics is not None:
+            self._metrics.add_rows(read=count)
+
+    def enable_metrics(self, hooks=()):
+        """ 메서드별 지연 시간 / 잠금 대기 / 행 수 계측을 켜는 메서드 (hook(kind, method, value) 등록 가능) """
+        if self._metrics is None:
+            self._metrics = SimpleDataMetrics(hooks)
+        else:
+            for hook in hooks:
+                self._metrics.add_hook(hook)
+        return self._metrics
+
+    def disable_metrics(self):
+        """ 계측을 끄고 모은 값을 버리는 메서드 """
+        self._metrics = None
+
+    def metrics_snapshot(self):
+        """ 계측 값 + OHLCV 캐시 / 연결 풀 상태를 dict로 반환 """
+        snapshot = self._metrics.snapshot() if self._metrics is not None else {"calls": {}, "phases": {}, "rows": {}}
+        if self._ohlcv_cache is not None:
+            snapshot["cache"] = self._ohlcv_cache.stats()
+        if self._pool is not None:
+            snapshot["pool"] = self._pool.stats()
+        return snapshot
+
+    def export_metrics(self, fmt="json"):
+        """ metrics_snapshot()을 JSON("json") 또는 Prometheus text("prometheus") 문자열로 반환 """
+        snapshot = self.metrics_snapshot()
+        if fmt == "json":
+            return json.dumps(snapshot)
+        if fmt == "prometheus":
+            return format_metrics_prometheus(snapshot)
+        raise ValueError(f"Unsupported metrics format: {fmt!r} (use 'json' or 'prometheus')")
+
+    def _create_schema(self, conn):
+        """ 모든 테이블을 생성하는 메서드 (풀 초기화 시 한 번 호출) """
+        for table_type in (TableType.Msg, TableType.Check):
+            self._ensure_string_table_exists(conn, self._get_table_name(table_type))
+        self._ensure_table_exists(conn)
+        self._ensure_ohlcv_table_exists(conn)
 
     def _get_table_name(self, table_type):
         """ Enum에 따라 테이블 이름을 반환하는 메서드 """
         return table_type.value
 
-    def load_strings(self, table_type):
-        """ 문자열을 로드하고 삭제하는 메서드 """
+    def _ensure_string_table_exists(self, conn, table_name):
+        """ 문자열 테이블이 존재하지 않으면 생성하는 메서드 """
+        if self._schema_ready:
+            return
+
+        cursor = conn.cursor()
+        cursor.execute(f'''
+            CREATE TABLE IF NOT EXISTS {table_name} (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                text_value TEXT NOT NULL
+            )
+        ''')
+        # reserve_strings로 가져간 메시지의 재노출 시각 (ack 전까지 다른 소비자에게 숨김)
+        cursor.execute(f'''
+            CREATE TABLE IF NOT EXISTS {table_name}_lease (
+                id INTEGER PRIMARY KEY,
+                visible_at REAL NOT NULL
+            )
+        ''')
+        cursor.close()
+
+    def _wait_for_strings(self, fetch, timeout, poll_interval):
+        """ fetch() 결과가 비어 있으면 timeout까지 poll_interval 간격으로 다시 시도하는 메서드 """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            result = fetch()
+            if result or deadline is None:
+                return result
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return result
+            # 트랜잭션 밖에서 대기하므로 그동안 add_string 생산자가 잠금을 얻을 수 있음
+            time.sleep(min(poll_interval, remaining))
+
+    def _pop_strings(self, table_type, limit):
+        """ id 순으로 최대 limit개(-1이면 전부) 문자열을 꺼내고 한 번의 범위 DELETE로 삭제하는 메서드 """
         conn = self._connect()
         cursor = conn.cursor()
         string_list = []
@@ -31,24 +839,34 @@ class SimpleData:
 
         try:
             # 트랜잭션 시작
-            conn.execute('BEGIN IMMEDIATE')
+            self._begin_immediate(conn)
 
             # 테이블이 존재하지 않으면 생성
-            cursor.execute(f'''
-                CREATE TABLE IF NOT EXISTS {table_name} (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    text_value TEXT NOT NULL
-                )
-            ''')
+            self._ensure_string_table_exists(conn, table_name)
 
-            # 테이블에서 모든 행을 SELECT
-            cursor.execute(f"SELECT id, text_value FROM {table_name}")
+            # reserve 중인(아직 ack 안 된) 행을 제외하고 id 순으로 SELECT
+            now = time.time()
+            cursor.execute(f'''
+                SELECT id, text_value FROM {table_name}
+                WHERE id NOT IN (SELECT id FROM {table_name}_lease WHERE visible_at > ?)
+                ORDER BY id
+                LIMIT ?
+            ''', (now, limit))
             rows = cursor.fetchall()
+            self._count_rows_read(len(rows))
 
-            # SELECT한 모든 행에 대해 DELETE 수행
-            for row in rows:
-                cursor.execute(f"DELETE FROM {table_name} WHERE id = ?", (row[0],))
-                string_list.append(row[1])  # 문자열을 리스트에 추가
+            if rows:
+                # 같은 쓰기 트랜잭션 안이므로 [첫 id, 마지막 id] 범위의 미예약 행 = SELECT한 행
+                first_id, last_id = rows[0][0], rows[-1][0]
+                cursor.execute(f'''
+                    DELETE FROM {table_name}
+                    WHERE id BETWEEN ? AND ?
+                      AND id NOT IN (SELECT id FROM {table_name}_lease WHERE visible_at > ?)
+                ''', (first_id, last_id, now))
+                cursor.execute(f'''
+                    DELETE FROM {table_name}_lease WHERE id BETWEEN ? AND ? AND visible_at <= ?
+                ''', (first_id, last_id, now))
+                string_list = [row[1] for row in rows]  # 문자열을 리스트에 추가
 
             # 변경 사항을 커밋
             conn.commit()
@@ -60,12 +878,108 @@ class SimpleData:
         finally:
             # 연결 종료
             cursor.close()
-            conn.close()
+            self._release(conn)
 
         return string_list
 
+    @_instrumented
+    def load_strings(self, table_type):
+        """ 문자열을 로드하고 삭제하는 메서드 """
+        return self._pop_strings(table_type, -1)
+
+    @_instrumented
+    def pop_strings(self, table_type, limit=100, timeout=None, poll_interval=0.1):
+        """ id 순으로 최대 limit개 문자열을 꺼내는 메서드 (timeout 초 동안 새 메시지를 기다릴 수 있음) """
+        return self._wait_for_strings(lambda: self._pop_strings(table_type, limit), timeout, poll_interval)
+
+    def _reserve_strings(self, table_type, limit, visibility_timeout):
+        """ 최대 limit개 메시지를 visibility_timeout 초 동안 숨기고 (id, 문자열)로 반환하는 메서드 """
+        conn = self._connect()
+        cursor = conn.cursor()
+        reserved = []
+
+        table_name = self._get_table_name(table_type)
+
+        try:
+            self._begin_immediate(conn)
+            self._ensure_string_table_exists(conn, table_name)
+
+            now = time.time()
+            cursor.execute(f'''
+                SELECT id, text_value FROM {table_name}
+                WHERE id NOT IN (SELECT id FROM {table_name}_lease WHERE visible_at > ?)
+                ORDER BY id
+                LIMIT ?
+            ''', (now, limit))
+            reserved = cursor.fetchall()
+            self._count_rows_read(len(reserved))
+
+            # ack_strings가 호출되지 않으면 visible_at 이후 다시 꺼낼 수 있음
+            cursor.executemany(f'''
+                REPLACE INTO {table_name}_lease (id, visible_at) VALUES (?, ?)
+            ''', [(row[0], now + visibility_timeout) for row in reserved])
+
+            conn.commit()
+
+        except sqlite3.DatabaseError as e:
+            print(f"Database error occurred: {e}")
+            conn.rollback()
+            reserved = []
+
+        finally:
+            cursor.close()
+            self._release(conn)
+
+        return reserved
+
+    @_instrumented
+    def reserve_strings(self, table_type, limit=100, visibility_timeout=30.0, timeout=None, poll_interval=0.1):
+        """ 최대 limit개 메시지를 예약하여 (id, 문자열) 리스트로 반환 (처리 후 ack_strings로 삭제) """
+        return self._wait_for_strings(
+            lambda: self._reserve_strings(table_type, limit, visibility_timeout), timeout, poll_interval)
+
+    @_instrumented
+    def ack_strings(self, table_type, ids):
+        """ reserve_strings로 가져간 메시지를 처리 완료로 표시하고 삭제하는 메서드 """
+        conn = self._connect()
+        cursor = conn.cursor()
+        ids = list(ids)
+        deleted_count = 0
+
+        table_name = self._get_table_name(table_type)
+
+        try:
+            self._begin_immediate(conn)
+            self._ensure_string_table_exists(conn, table_name)
+
+            for start in range(0, len(ids), MAX_IN_PARAMS):
+                chunk = ids[start:start + MAX_IN_PARAMS]
+                placeholders = ", ".join("?" * len(chunk))
+                cursor.execute(f"DELETE FROM {table_name} WHERE id IN ({placeholders})", chunk)
+                deleted_count += cursor.rowcount
+                cursor.execute(f"DELETE FROM {table_name}_lease WHERE id IN ({placeholders})", chunk)
+
+            conn.commit()
+
+        except sqlite3.DatabaseError as e:
+            print(f"Database error occurred: {e}")
+            conn.rollback()
+            deleted_count = 0
+
+        finally:
+            cursor.close()
+            self._release(conn)
+
+        return deleted_count
+
+    @_instrumented
     def add_string(self, table_type, text_value):
         """ 문자열을 추가하는 메서드 """
+        if self._write_buffer is not None:
+            # 쓰기 버퍼 사용 중이면 메모리에 모았다가 백그라운드에서 한 번에 저장
+            self._write_buffer.add(table_type, text_value)
+            return
+
         conn = self._connect()
         cursor = conn.cursor()
 
@@ -73,15 +987,10 @@ class SimpleData:
 
         try:
             # 트랜잭션 시작
-            conn.execute('BEGIN IMMEDIATE')
+            self._begin_immediate(conn)
 
             # 테이블이 존재하지 않으면 생성
-            cursor.execute(f'''
-                CREATE TABLE IF NOT EXISTS {table_name} (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    text_value TEXT NOT NULL
-                )
-            ''')
+            self._ensure_string_table_exists(conn, table_name)
 
             # 문자열을 테이블에 삽입
             cursor.execute(f"INSERT INTO {table_name} (text_value) VALUES (?)", (text_value,))
@@ -96,10 +1005,75 @@ class SimpleData:
         finally:
             # 연결 종료
             cursor.close()
-            conn.close()
+            self._release(conn)
+
+    def _add_strings_grouped(self, grouped):
+        """ {table_type: [문자열, ...]}을 하나의 트랜잭션으로 저장하는 메서드 (성공 여부 반환) """
+        conn = self._connect()
+        cursor = conn.cursor()
+        success = False
+
+        try:
+            # 트랜잭션 시작 (BEGIN/COMMIT과 fsync는 배치당 한 번)
+            self._begin_immediate(conn)
+
+            for table_type, text_values in grouped.items():
+                table_name = self._get_table_name(table_type)
+                self._ensure_string_table_exists(conn, table_name)
+                cursor.executemany(f"INSERT INTO {table_name} (text_value) VALUES (?)",
+                                   [(text_value,) for text_value in text_values])
+
+            conn.commit()
+            success = True
+
+        except sqlite3.DatabaseError as e:
+            print(f"Database error occurred: {e}")
+            conn.rollback()
+
+        finally:
+            cursor.close()
+            self._release(conn)
+
+        return success
+
+    @_instrumented
+    def add_strings(self, table_type, text_values):
+        """ 여러 문자열을 하나의 트랜잭션으로 추가하는 메서드 (저장된 개수 반환) """
+        text_values = list(text_values)
+        if not text_values:
+            return 0
+        return len(text_values) if self._add_strings_grouped({table_type: text_values}) else 0
+
+    def enable_write_buffer(self, max_items=500, flush_interval=0.5):
+        """ add_string 호출을 모았다가 max_items개 또는 flush_interval초마다 한 번에 저장하도록 설정 """
+        if self._write_buffer is None:
+            self._write_buffer = StringWriteBuffer(self, max_items=max_items, flush_interval=flush_interval)
+        return self._write_buffer
+
+    def enable_ohlcv_cache(self, max_entries=128, ttl=60.0):
+        """ get_ohlcv_data / get_latest_ohlcv_timestamp(s) 결과를 LRU + TTL 캐시에 보관하도록 설정 """
+        if self._ohlcv_cache is None:
+            self._ohlcv_cache = OHLCVCache(max_entries=max_entries, ttl=ttl)
+            if self._replica_path is not None:
+                self._ohlcv_cache.max_ttl = self._replica_max_lag
+        return self._ohlcv_cache
+
+    def _invalidate_ohlcv_cache(self, ticker=None):
+        """ OHLCV 데이터 변경 시 해당 티커(None이면 전체)의 캐시 무효화 """
+        if self._ohlcv_cache is not None:
+            self._ohlcv_cache.invalidate(ticker)
+
+    @_instrumented
+    def flush_writes(self):
+        """ 쓰기 버퍼에 남아 있는 문자열을 즉시 저장하는 메서드 """
+        if self._write_buffer is not None:
+            self._write_buffer.flush()
 
     def _ensure_table_exists(self, conn):
         """ 테이블이 존재하지 않으면 생성하는 메서드 """
+        if self._schema_ready:
+            return
+
         cursor = conn.cursor()
         cursor.execute('''
             CREATE TABLE IF NOT EXISTS common_data (
@@ -116,8 +1090,12 @@ class SimpleData:
                 date TEXT NOT NULL
             )
         ''')
+        # type별 날짜 조회 / 날짜 기준 삭제가 테이블 전체를 스캔하지 않도록 인덱스 생성
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_common_data_type_date ON common_data (type, date)')
+        cursor.execute('CREATE INDEX IF NOT EXISTS idx_common_data_date ON common_data (date)')
         cursor.close()
 
+    @_instrumented
     def insert_common_data(self, data_type, value1, value2, value3, value4, number1, number2, number3, number4, record_date):
         """ 데이터를 삽입하는 메서드 """
         conn = self._connect()
@@ -140,59 +1118,159 @@ class SimpleData:
 
         finally:
             cursor.close()
-            conn.close()
+            self._release(conn)
+
+    @_instrumented
+    def insert_common_data_many(self, records, chunk_size=DEFAULT_CHUNK_SIZE):
+        """ 여러 행을 하나의 트랜잭션으로 삽입하는 메서드 (삽입한 행 수 반환)
+
+        records는 DataFrame 또는 레코드 iterable이다. DataFrame / dict 레코드는 type, date 컬럼(키)이 필수이고
+        value1~4 / number1~4는 없으면 NULL로 저장한다. 튜플 레코드는 insert_common_data 인자 순서를 따른다.
+        """
+        rows = self._prepare_common_rows(records)
+        if not rows:
+            return 0
 
-    def get_common_data(self, data_type, query_date):
-        """ 특정 날짜의 데이터를 조회하는 메서드 """
         conn = self._connect()
         cursor = conn.cursor()
-        result = []
+        inserted = 0
 
         try:
+            self._begin_immediate(conn)
             self._ensure_table_exists(conn)
-            date_str = query_date.strftime("%Y-%m-%d")
 
-            cursor.execute('''
-                SELECT * FROM common_data
-                WHERE type = ? AND DATE(date) = ?
-            ''', (data_type, date_str))
-            result = cursor.fetchall()
+            for start in range(0, len(rows), chunk_size):
+                cursor.executemany('''
+                    INSERT INTO common_data (type, value1, value2, value3, value4, number1, number2, number3, number4, date)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', rows[start:start + chunk_size])
+
+            conn.commit()
+            inserted = len(rows)
+            print(f"Inserted {inserted} record(s) into common_data")
 
         except sqlite3.DatabaseError as e:
             print(f"Database error occurred: {e}")
+            conn.rollback()
 
         finally:
             cursor.close()
-            conn.close()
-
-        return result
-
-    def get_common_data_between_dates(self, data_type, start_date, end_date):
-        """ 두 날짜 사이의 데이터를 조회하는 메서드 """
-        conn = self._connect()
+            self._release(conn)
+
+        return inserted
+
+    def _prepare_common_rows(self, records):
+        """ DataFrame / dict / 튜플 레코드를 INSERT 파라미터 튜플 목록으로 변환하는 메서드 """
+        columns = COMMON_DATA_COLUMNS[1:]
+
+        if _is_dataframe(records):
+            missing = {"type", "date"} - set(records.columns)
+            if missing:
+                raise ValueError(f"common_data records need columns: {', '.join(sorted(missing))}")
+
+            values = []
+            for name in columns:
+                if name not in records.columns:
+                    values.append([None] * len(records))
+                elif name == "date":
+                    values.append(pd.to_datetime(records[name]).dt.strftime("%Y-%m-%d %H:%M:%S").tolist())
+                elif name.startswith("number"):
+                    values.append(records[name].astype("float64").tolist())  # NaN은 NULL로 저장됨
+                else:
+                    series = records[name].astype(object)
+                    values.append(series.where(series.notna(), None).tolist())
+            return list(zip(*values))
+
+        rows = []
+        for record in records:
+            if isinstance(record, dict):
+                record = tuple(record.get(name) for name in columns)
+            record_date = record[-1]
+            if record_date is None:
+                raise ValueError("common_data records need a date")
+            if not isinstance(record_date, str):
+                record_date = record_date.strftime("%Y-%m-%d %H:%M:%S")
+            rows.append((*record[:-1], record_date))
+        return rows
+
+    def _common_select_columns(self, columns):
+        """ 조회할 common_data 컬럼 목록 검증 (None이면 전체) """
+        if columns is None:
+            return list(COMMON_DATA_COLUMNS)
+        columns = list(columns)
+        unknown = [name for name in columns if name not in COMMON_DATA_COLUMNS]
+        if unknown:
+            raise ValueError(f"Unknown common_data column(s): {', '.join(unknown)}")
+        return columns
+
+    def _common_frame_from_rows(self, rows, columns):
+        """ fetch한 행 튜플을 컬럼 타입(int64 / float64 / datetime64 / object)에 맞는 DataFrame으로 변환 """
+        values = list(zip(*rows)) if rows else [()] * len(columns)
+        data = {}
+        for name, column in zip(columns, values):
+            if name == "id":
+                data[name] = np.array(column, dtype="int64")
+            elif name == "date":
+                data[name] = np.array(column, dtype="datetime64[s]").astype("datetime64[ns]")
+            elif name.startswith("number"):
+                data[name] = np.array(column, dtype="float64")  # NULL은 NaN으로 변환
+            else:
+                data[name] = np.array(column, dtype=object)
+        return pd.DataFrame(data, columns=columns, copy=False)
+
+    def _select_common_data(self, where, params, columns, as_frame):
+        """ common_data에서 where 조건에 맞는 행을 튜플 목록 또는 타입이 지정된 DataFrame으로 조회 """
+        select_columns = self._common_select_columns(columns)
+        conn = self._connect(read=True)
         cursor = conn.cursor()
         result = []
 
         try:
             self._ensure_table_exists(conn)
-            start_date_str = start_date.strftime("%Y-%m-%d %H:%M:%S")
-            end_date_str = end_date.strftime("%Y-%m-%d %H:%M:%S")
-
-            cursor.execute('''
-                SELECT * FROM common_data
-                WHERE type = ? AND date BETWEEN ? AND ?
-            ''', (data_type, start_date_str, end_date_str))
+            select_sql = "*" if columns is None else ", ".join(select_columns)
+            cursor.execute(f"SELECT {select_sql} FROM common_data WHERE {where}", params)
             result = cursor.fetchall()
+            self._count_rows_read(len(result))
 
         except sqlite3.DatabaseError as e:
             print(f"Database error occurred: {e}")
 
         finally:
             cursor.close()
-            conn.close()
+            self._release(conn)
 
-        return result
+        if not as_frame:
+            return result
+
+        frame_start = time.perf_counter()
+        frame = self._common_frame_from_rows(result, select_columns)
+        self._observe_phase("frame", frame_start)
+        return frame
+
+    @_instrumented
+    def get_common_data(self, data_type, query_date, columns=None, as_frame=False):
+        """ 특정 날짜의 데이터를 조회하는 메서드
 
+        columns로 조회할 컬럼을 고를 수 있고, as_frame=True면 date를 datetime64로 변환한 DataFrame을 반환한다.
+        """
+        # DATE(date) = ? 대신 인덱스를 탈 수 있는 [당일, 다음날) 범위 조건 사용
+        day_start = datetime.datetime(query_date.year, query_date.month, query_date.day)
+        start_str = day_start.strftime("%Y-%m-%d")
+        end_str = (day_start + datetime.timedelta(days=1)).strftime("%Y-%m-%d")
+
+        return self._select_common_data("type = ? AND date >= ? AND date < ?",
+                                        (data_type, start_str, end_str), columns, as_frame)
+
+    @_instrumented
+    def get_common_data_between_dates(self, data_type, start_date, end_date, columns=None, as_frame=False):
+        """ 두 날짜 사이의 데이터를 조회하는 메서드 (columns / as_frame은 get_common_data와 같음) """
+        start_date_str = start_date.strftime("%Y-%m-%d %H:%M:%S")
+        end_date_str = end_date.strftime("%Y-%m-%d %H:%M:%S")
+
+        return self._select_common_data("type = ? AND date BETWEEN ? AND ?",
+                                        (data_type, start_date_str, end_date_str), columns, as_frame)
+
+    @_instrumented
     def update_common_data(self, record_id, value1, value2, value3, value4, number1, number2, number3, number4, record_date):
         """ 특정 ID의 데이터를 업데이트하는 메서드 """
         conn = self._connect()
@@ -218,8 +1296,9 @@ class SimpleData:
 
         finally:
             cursor.close()
-            conn.close()
+            self._release(conn)
 
+    @_instrumented
     def delete_common_data_by_id(self, record_id):
         """ 특정 ID의 데이터를 삭제하는 메서드 """
         conn = self._connect()
@@ -242,10 +1321,14 @@ class SimpleData:
 
         finally:
             cursor.close()
-            conn.close()
+            self._release(conn)
+
+    @_instrumented
+    def delete_common_data(self, days, batch_size=None):
+        """ 오래된 데이터를 삭제하는 메서드 (batch_size를 주면 배치 단위로 나눠 삭제) """
+        if batch_size is not None:
+            return self.purge_old_data(ohlcv_years=None, common_days=days, batch_size=batch_size, vacuum=False)
 
-    def delete_common_data(self, days):
-        """ 오래된 데이터를 삭제하는 메서드 """
         conn = self._connect()
         cursor = conn.cursor()
 
@@ -268,15 +1351,22 @@ class SimpleData:
 
         finally:
             cursor.close()
-            conn.close()
+            self._release(conn)
 
     def _ensure_ohlcv_table_exists(self, conn):
         """ OHLCV 테이블이 존재하지 않으면 생성 """
+        if self._schema_ready:
+            return
+
+        self._create_ohlcv_table(conn, TableType.OHLCV.value)
+
+    def _create_ohlcv_table(self, conn, table_name):
+        """ epoch 밀리초 timestamp, (ticker, timestamp) 클러스터링 OHLCV 테이블 생성 """
         cursor = conn.cursor()
         cursor.execute(f'''
-            CREATE TABLE IF NOT EXISTS {TableType.OHLCV.value} (
+            CREATE TABLE IF NOT EXISTS {table_name} (
                 ticker TEXT NOT NULL,
-                timestamp TEXT NOT NULL,
+                timestamp INTEGER NOT NULL,  -- epoch 밀리초
                 open REAL,
                 high REAL,
                 low REAL,
@@ -285,43 +1375,305 @@ class SimpleData:
                 value REAL,
                 price_change REAL,
                 PRIMARY KEY (ticker, timestamp)  -- 중복 방지
-            )
+            ) WITHOUT ROWID
         ''')
         cursor.close()
 
-    def insert_ohlcv_data(self, ticker, df):
-        """ 특정 코인의 OHLCV 데이터를 저장하는 메서드 (중복 방지: REPLACE INTO) """
+    def _schema_key(self, conn):
+        """ 스키마 캐시 키: (사본 세대, PRAGMA schema_version) (다른 연결/프로세스의 테이블 생성·교체 감지용)
+
+        backup API로 만든 사본은 schema_version이 항상 1이므로 사본 연결은 사본 파일 세대로 구분한다.
+        """
+        return getattr(conn, "generation", None), conn.execute("PRAGMA schema_version").fetchone()[0]
+
+    def _ohlcv_storage_is_epoch(self, conn):
+        """ OHLCV 테이블이 epoch 밀리초(INTEGER) 형식인지 확인 (기존 TEXT 형식이면 False)
+
+        다른 인스턴스가 migrate_ohlcv_to_epoch로 테이블을 교체할 수 있으므로 schema_version(사본은 사본 세대)이 바뀌면 다시 확인한다.
+        """
+        version = self._schema_key(conn)
+        if self._ohlcv_epoch is None or self._ohlcv_epoch[0] != version:
+            cursor = conn.cursor()
+            cursor.execute(f"PRAGMA table_info({TableType.OHLCV.value})")
+            column_types = {row[1]: row[2].upper() for row in cursor.fetchall()}
+            cursor.close()
+
+            if not column_types:
+                return True  # 테이블이 아직 없으면 새 형식으로 생성됨
+            self._ohlcv_epoch = (version, column_types.get("timestamp") == "INTEGER")
+
+        return self._ohlcv_epoch[1]
+
+    def _ohlcv_ts_param(self, conn, value, epoch=None):
+        """ datetime을 OHLCV 저장 형식에 맞는 바인딩 값으로 변환 """
+        if epoch is None:
+            epoch = self._ohlcv_storage_is_epoch(conn)
+        if epoch:
+            return _to_epoch_ms(value)
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+
+    def _ohlcv_select_columns(self, conn, raw=False, epoch=None):
+        """ OHLCV SELECT 컬럼 목록 (raw=False면 timestamp를 기존과 같은 문자열로 반환) """
+        if epoch is None:
+            epoch = self._ohlcv_storage_is_epoch(conn)
+        timestamp = "timestamp"
+        if not raw and epoch:
+            timestamp = _EPOCH_MS_AS_TEXT.format(column="timestamp") + " AS timestamp"
+        return ", ".join([OHLCV_COLUMNS[0], timestamp] + OHLCV_COLUMNS[2:])
+
+    def _last_stored_close(self, cursor, ticker, before, table_name=TableType.OHLCV.value):
+        """ before 이전에 저장된 마지막 close 반환 (PK (ticker, timestamp) 인덱스 역방향 조회 1회) """
+        cursor.execute(f'''
+            SELECT close FROM {table_name}
+            WHERE ticker = ? AND timestamp < ?
+            ORDER BY timestamp DESC
+            LIMIT 1
+        ''', (ticker, before))
+        row = cursor.fetchone()
+        return None if row is None else row[0]
+
+    def _update_next_price_change(self, cursor, ticker, rows):
+        """ 증분 저장한 행들 바로 뒤에 이미 저장된 행의 price_change를 새 마지막 close 기준으로 갱신
+
+        과거 구간을 보충하거나 덮어쓴 경우 뒤쪽 행의 변동률이 이전 close 기준으로 남지 않도록 한다 (롤업과 같은 방식).
+        """
+        if not rows:
+            return
+        last_row = rows[-1]
+        cursor.execute(f'''
+            UPDATE {TableType.OHLCV.value} SET price_change = (close / ? - 1) * 100
+            WHERE ticker = ? AND timestamp = (
+                SELECT MIN(timestamp) FROM {TableType.OHLCV.value} WHERE ticker = ? AND timestamp > ?
+            )
+        ''', (last_row[5], ticker, ticker, last_row[1]))
+
+    def _prepare_ohlcv_rows(self, ticker, df, epoch=True, cursor=None):
+        """ DataFrame을 컬럼 단위로 한 번에 변환하여 INSERT용 튜플 리스트를 만드는 메서드
+
+        cursor가 주어지면(증분 모드) 이미 저장된 직전 close로 첫 행의 price_change를 이어서 계산한다.
+        """
+        # 데이터프레임의 인덱스를 timestamp 컬럼으로 변환
+        if "timestamp" not in df.columns:
+            df["timestamp"] = df.index  # 인덱스를 timestamp 컬럼으로 설정
+
+        if epoch:
+            # 벽시계 기준 epoch 밀리초로 한 번에 변환 (tz-aware면 tzinfo만 제거)
+            timestamps = pd.to_datetime(df["timestamp"])
+            if timestamps.dt.tz is not None:
+                timestamps = timestamps.dt.tz_localize(None)
+            timestamp_values = timestamps.to_numpy(dtype="datetime64[ms]").astype("int64").tolist()
+
+        # timestamp 값을 문자열로 변환 (SQLite에서 처리 가능하도록)
+        df["timestamp"] = df["timestamp"].astype(str)
+        if not epoch:
+            timestamp_values = df["timestamp"].tolist()
+
+        # 변동률 계산
+        if cursor is not None and len(df):
+            # 증분 모드: 전체 이력을 다시 읽지 않고 직전 close 하나로 첫 행을 이어서 계산
+            prev_close = df["close"].shift(1)
+            prev_close.iloc[0] = self._last_stored_close(cursor, ticker, timestamp_values[0])
+            df["price_change"] = (df["close"] / prev_close - 1) * 100  # 변동률 계산 (퍼센트)
+        else:
+            df["price_change"] = df["close"].pct_change() * 100  # 변동률 계산 (퍼센트)
+
+        # DataFrame에 ticker 컬럼 추가
+        df["ticker"] = ticker
+
+        # iterrows 대신 컬럼별로 한 번만 파이썬 값으로 변환한 뒤 행 튜플로 묶음
+        columns = [timestamp_values]
+        columns += [df[col].to_numpy(dtype="float64").tolist() for col in OHLCV_COLUMNS[2:]]
+        return list(zip(itertools.repeat(ticker, len(df)), *columns))
+
+    def _replace_ohlcv_rows(self, cursor, rows, chunk_size):
+        """ 준비된 OHLCV 행들을 chunk_size 단위 executemany로 저장하는 메서드 """
+        sql = f'''
+            REPLACE INTO {TableType.OHLCV.value}
+            (ticker, timestamp, open, high, low, close, volume, value, price_change)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        '''
+        for start in range(0, len(rows), chunk_size):
+            cursor.executemany(sql, rows[start:start + chunk_size])
+
+    def _rollup_table_name(self, interval):
+        """ 롤업 간격에 해당하는 테이블 이름 (예: table_ohlcv_data_1h) """
+        if interval not in ROLLUP_INTERVALS:
+            raise ValueError(f"Unsupported OHLCV interval: {interval} (supported: {', '.join(ROLLUP_INTERVALS)})")
+        return f"{TableType.OHLCV.value}_{interval}"
+
+    def _active_rollups(self, conn):
+        """ 이 DB에 생성되어 있는 롤업 간격 목록 (다른 인스턴스/프로세스가 나중에 만든 롤업도 함께 유지)
+
+        _schema_key가 바뀌었을 때만 sqlite_master를 다시 읽으므로 쓰기 트랜잭션 안에서 호출해도 비용이 작다.
+        """
+        version = self._schema_key(conn)
+        if self._rollups is None or self._rollups[0] != version:
+            cursor = conn.cursor()
+            cursor.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+            tables = {row[0] for row in cursor.fetchall()}
+            cursor.close()
+            self._rollups = (version, [interval for interval in ROLLUP_INTERVALS
+                                       if self._rollup_table_name(interval) in tables])
+        return self._rollups[1]
+
+    def _ohlcv_source(self, conn, interval):
+        """ 조회 대상 테이블 이름과 timestamp 형식 반환 (interval=None이면 원본 테이블) """
+        if interval is None:
+            return TableType.OHLCV.value, self._ohlcv_storage_is_epoch(conn)
+        table_name = self._rollup_table_name(interval)
+        if interval not in self._active_rollups(conn):
+            raise ValueError(f"OHLCV rollup for interval {interval} is not enabled (call enable_rollups first)")
+        return table_name, True
+
+    def _update_rollups(self, cursor, ticker, first_ms, last_ms):
+        """ 원본 [first_ms, last_ms]가 걸친 롤업 버킷만 다시 집계하여 저장하는 메서드 """
+        conn = cursor.connection
+        epoch = self._ohlcv_storage_is_epoch(conn)
+
+        for interval in self._active_rollups(conn):
+            size = ROLLUP_INTERVALS[interval]
+            table_name = self._rollup_table_name(interval)
+            bucket_start = first_ms - first_ms % size
+            bucket_end = last_ms - last_ms % size + size
+
+            # 영향받는 버킷 범위의 원본 행만 읽어 집계
+            cursor.execute(f'''
+                SELECT {self._ohlcv_select_columns(conn, raw=True)} FROM {TableType.OHLCV.value}
+                WHERE ticker = ? AND timestamp >= ? AND timestamp < ?
+                ORDER BY timestamp
+            ''', (ticker,
+                  self._ohlcv_ts_param(conn, _EPOCH + bucket_start * _ONE_MS, epoch),
+                  self._ohlcv_ts_param(conn, _EPOCH + bucket_end * _ONE_MS, epoch)))
+            frame = self._ohlcv_frame_from_rows(cursor.fetchall(), epoch)
+            if frame.empty:
+                continue
+
+            timestamps = frame["timestamp"].to_numpy(dtype="datetime64[ms]").astype("int64")
+            grouped = frame.groupby(timestamps - timestamps % size, sort=True)
+            bars = pd.DataFrame({
+                "open": grouped["open"].first(),
+                "high": grouped["high"].max(),
+                "low": grouped["low"].min(),
+                "close": grouped["close"].last(),
+                "volume": grouped["volume"].sum(),
+                "value": grouped["value"].sum(),
+            })
+
+            # 직전 버킷 close로 첫 버킷의 변동률을 이어서 계산
+            prev_close = bars["close"].shift(1)
+            prev_close.iloc[0] = self._last_stored_close(cursor, ticker, bucket_start, table_name)
+            bars["price_change"] = (bars["close"] / prev_close - 1) * 100
+
+            columns = [bars.index.tolist()]
+            columns += [bars[col].to_numpy(dtype="float64").tolist() for col in OHLCV_COLUMNS[2:]]
+            cursor.executemany(f'''
+                REPLACE INTO {table_name}
+                (ticker, timestamp, open, high, low, close, volume, value, price_change)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', list(zip(itertools.repeat(ticker, len(bars)), *columns)))
+
+            # 뒤쪽 기존 버킷(과거 데이터 보충 시)의 변동률도 새 close 기준으로 갱신
+            cursor.execute(f'''
+                UPDATE {table_name} SET price_change = (close / ? - 1) * 100
+                WHERE ticker = ? AND timestamp = (
+                    SELECT MIN(timestamp) FROM {table_name} WHERE ticker = ? AND timestamp >= ?
+                )
+            ''', (float(bars["close"].iloc[-1]), ticker, ticker, bucket_end))
+
+    def _update_rollups_for_rows(self, cursor, ticker, rows):
+        """ 방금 저장한 원본 행들의 timestamp 범위로 롤업을 갱신하는 메서드 """
+        if not rows or not self._active_rollups(cursor.connection):
+            return
+
+        timestamps = self._timestamps_to_ms(cursor.connection, [row[1] for row in rows])
+        self._update_rollups(cursor, ticker, min(timestamps), max(timestamps))
+
+    def _timestamps_to_ms(self, conn, timestamps):
+        """ 저장 형식(epoch 밀리초 또는 TEXT)의 timestamp 값들을 epoch 밀리초 리스트로 변환 (None은 그대로) """
+        timestamps = list(timestamps)
+        if self._ohlcv_storage_is_epoch(conn) or None in timestamps:
+            return timestamps
+        return np.array(timestamps, dtype="datetime64[ms]").astype("int64").tolist()
+
+    def enable_rollups(self, intervals=tuple(ROLLUP_INTERVALS), window_days=30, pause=0.05):
+        """ 지정한 간격(1h/4h/1d)의 롤업 테이블을 만들고 기존 데이터로 채우는 메서드
+
+        테이블을 먼저 만들어 커밋하므로 그 뒤 저장되는 행은 insert 쪽에서 바로 롤업된다. 기존 데이터는
+        티커별 window_days일 구간마다 커밋하고 pause초 동안 쓰기 잠금을 놓아 수집(ingest)이 타임아웃되지 않게 한다.
+        """
         conn = self._connect()
         cursor = conn.cursor()
+        # 구간 경계를 가장 긴 롤업 간격(1d)에 맞춰 버킷이 두 구간에 걸치지 않게 함
+        window = window_days * max(ROLLUP_INTERVALS.values())
 
         try:
+            self._begin_immediate(conn)
             self._ensure_ohlcv_table_exists(conn)
 
-            # 데이터프레임의 인덱스를 timestamp 컬럼으로 변환
-            if "timestamp" not in df.columns:
-                df["timestamp"] = df.index  # 인덱스를 timestamp 컬럼으로 설정
-            
-            # timestamp 값을 문자열로 변환 (SQLite에서 처리 가능하도록)
-            df["timestamp"] = df["timestamp"].astype(str)
+            for interval in intervals:
+                self._create_ohlcv_table(conn, self._rollup_table_name(interval))
+            conn.commit()
+            self._rollups = None
 
-            # 변동률 계산
-            df["price_change"] = df["close"].pct_change() * 100  # 변동률 계산 (퍼센트)
+            # 기존 원본 데이터로 롤업 채우기 (구간마다 별도 트랜잭션, 앞 구간의 마지막 close를 이어서 변동률 계산)
+            for ticker in self._distinct_tickers(conn, TableType.OHLCV.value):
+                cursor.execute(f'''
+                    SELECT MIN(timestamp), MAX(timestamp) FROM {TableType.OHLCV.value} WHERE ticker = ?
+                ''', (ticker,))
+                first, last = self._timestamps_to_ms(conn, cursor.fetchone())
+                if first is None:
+                    continue
+                for start in range(first - first % window, last + 1, window):
+                    self._begin_immediate(conn)
+                    self._update_rollups(cursor, ticker, max(start, first), min(start + window - 1, last))
+                    conn.commit()
+                    time.sleep(pause)
+
+            self._invalidate_ohlcv_cache()
+            print(f"✅ OHLCV rollups enabled: {', '.join(self._active_rollups(conn))}")
+            # 사본에도 롤업 테이블이 바로 생기도록 갱신 (사본을 쓰지 않으면 아무 일도 안 함)
+            self.refresh_replica()
 
-            # DataFrame에 ticker 컬럼 추가
-            df["ticker"] = ticker
+        except sqlite3.DatabaseError as e:
+            print(f"❌ Database error occurred: {e}")
+            conn.rollback()
+            self._rollups = None
+
+        finally:
+            cursor.close()
+            self._release(conn)
+
+    @_instrumented
+    def insert_ohlcv_data(self, ticker, df, chunk_size=DEFAULT_CHUNK_SIZE, incremental=False):
+        """ 특정 코인의 OHLCV 데이터를 저장하는 메서드 (중복 방지: REPLACE INTO)
+
+        incremental=True면 저장된 직전 close를 이어받아 새 행들의 price_change만 계산한다.
+        """
+        conn = self._connect()
+        cursor = conn.cursor()
+
+        try:
+            if incremental:
+                # 직전 close 조회와 저장 사이에 다른 writer가 끼어들지 않도록 쓰기 잠금을 먼저 잡음
+                self._begin_immediate(conn)
+            self._ensure_ohlcv_table_exists(conn)
+
+            epoch = self._ohlcv_storage_is_epoch(conn)
+            rows = self._prepare_ohlcv_rows(ticker, df, epoch, cursor if incremental else None)
+            if not incremental:
+                # 변환은 잠금 밖에서 하고, 쓰기 잠금을 잡은 뒤 그사이 저장 형식이 바뀌었으면(마이그레이션) 다시 변환
+                self._begin_immediate(conn)
+                if self._ohlcv_storage_is_epoch(conn) != epoch:
+                    rows = self._prepare_ohlcv_rows(ticker, df, not epoch)
+
+            # 기존 데이터를 덮어쓰기 위해 REPLACE INTO 사용 (chunk 단위 executemany)
+            self._replace_ohlcv_rows(cursor, rows, chunk_size)
+            if incremental:
+                self._update_next_price_change(cursor, ticker, rows)
+            self._update_rollups_for_rows(cursor, ticker, rows)
 
-            # 기존 데이터를 덮어쓰기 위해 REPLACE INTO 사용
-            for _, row in df.iterrows():
-                cursor.execute(f'''
-                    REPLACE INTO {TableType.OHLCV.value} 
-                    (ticker, timestamp, open, high, low, close, volume, value, price_change)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    row["ticker"], row["timestamp"], row["open"], row["high"],
-                    row["low"], row["close"], row["volume"], row["value"], row["price_change"]
-                ))
-            
             conn.commit()
+            self._invalidate_ohlcv_cache(ticker)
             print(f"✅ {ticker} OHLCV 데이터 저장 완료! {len(df)}개 행 삽입 (중복 제거)")
 
         except sqlite3.DatabaseError as e:
@@ -330,8 +1682,46 @@ class SimpleData:
 
         finally:
             cursor.close()
-            conn.close()
+            self._release(conn)
 
+    @_instrumented
+    def insert_ohlcv_data_many(self, frames, chunk_size=DEFAULT_CHUNK_SIZE, incremental=False):
+        """ {ticker: DataFrame} 딕셔너리의 OHLCV 데이터를 하나의 트랜잭션으로 저장하는 메서드 """
+        conn = self._connect()
+        cursor = conn.cursor()
+        total_rows = 0
+
+        try:
+            # 트랜잭션 시작 (모든 티커를 한 번에 커밋)
+            self._begin_immediate(conn)
+            self._ensure_ohlcv_table_exists(conn)
+
+            for ticker, df in frames.items():
+                rows = self._prepare_ohlcv_rows(ticker, df, self._ohlcv_storage_is_epoch(conn),
+                                                cursor if incremental else None)
+                self._replace_ohlcv_rows(cursor, rows, chunk_size)
+                if incremental:
+                    self._update_next_price_change(cursor, ticker, rows)
+                self._update_rollups_for_rows(cursor, ticker, rows)
+                total_rows += len(rows)
+
+            conn.commit()
+            for ticker in frames:
+                self._invalidate_ohlcv_cache(ticker)
+            print(f"✅ {len(frames)}개 티커 OHLCV 데이터 저장 완료! {total_rows}개 행 삽입 (중복 제거)")
+
+        except sqlite3.DatabaseError as e:
+            print(f"❌ Database error occurred: {e}")
+            conn.rollback()
+            total_rows = 0
+
+        finally:
+            cursor.close()
+            self._release(conn)
+
+        return total_rows
+
+    @_instrumented
     def delete_ohlcv_by_ticker(self, ticker):
         """ 특정 티커의 모든 OHLCV 데이터를 삭제하는 메서드 """
         conn = self._connect()
@@ -340,7 +1730,10 @@ class SimpleData:
         try:
             cursor.execute(f"DELETE FROM {TableType.OHLCV.value} WHERE ticker = ?", (ticker,))
             deleted_count = cursor.rowcount
+            for interval in self._active_rollups(conn):
+                cursor.execute(f"DELETE FROM {self._rollup_table_name(interval)} WHERE ticker = ?", (ticker,))
             conn.commit()
+            self._invalidate_ohlcv_cache(ticker)
             print(f"🗑️ Deleted {deleted_count} records for ticker: {ticker}")
 
         except sqlite3.DatabaseError as e:
@@ -349,74 +1742,295 @@ class SimpleData:
 
         finally:
             cursor.close()
-            conn.close()
-
-    def get_ohlcv_data(self, ticker, start_date, end_date):
-        """ 특정 코인의 날짜 범위 OHLCV 데이터를 조회하는 메서드 """
-        conn = self._connect()
+            self._release(conn)
+
+    @_instrumented
+    def get_ohlcv_data(self, ticker, start_date, end_date, interval=None, as_frame=True):
+        """ 특정 코인의 날짜 범위 OHLCV 데이터를 조회하는 메서드 (interval: None이면 원본, "1h"/"4h"/"1d"면 롤업)
+
+        as_frame=False면 pandas 없이 OHLCV_COLUMNS 순서의 행 튜플 리스트를 반환한다 (캐시는 사용하지 않음).
+        """
+        use_cache = as_frame and self._ohlcv_cache is not None
+        if use_cache:
+            start_key = start_date.strftime("%Y-%m-%d %H:%M:%S")
+            end_key = end_date.strftime("%Y-%m-%d %H:%M:%S")
+            cached = self._ohlcv_cache.get_range(ticker, start_key, end_key, interval)
+            if cached is not None:
+                return cached
+            cache_version = self._ohlcv_cache.version()
+
+        conn = self._connect(read=True)
         cursor = conn.cursor()
         result = []
 
         try:
             self._ensure_ohlcv_table_exists(conn)
-            start_date_str = start_date.strftime("%Y-%m-%d %H:%M:%S")
-            end_date_str = end_date.strftime("%Y-%m-%d %H:%M:%S")
+            table_name, epoch = self._ohlcv_source(conn, interval)
+            start_param = self._ohlcv_ts_param(conn, start_date, epoch)
+            end_param = self._ohlcv_ts_param(conn, end_date, epoch)
 
             cursor.execute(f'''
-                SELECT * FROM {TableType.OHLCV.value}
+                SELECT {self._ohlcv_select_columns(conn, epoch=epoch)} FROM {table_name}
                 WHERE ticker = ? AND timestamp BETWEEN ? AND ?
-            ''', (ticker, start_date_str, end_date_str))
+            ''', (ticker, start_param, end_param))
             rows = cursor.fetchall()
+            self._count_rows_read(len(rows))
+            if not as_frame:
+                return rows
 
             # 결과를 DataFrame으로 변환
-            columns = ["ticker", "timestamp", "open", "high", "low", "close", "volume", "value", "price_change"]
-            result = pd.DataFrame(rows, columns=columns)
+            frame_start = time.perf_counter()
+            result = pd.DataFrame(rows, columns=OHLCV_COLUMNS)
+            self._observe_phase("frame", frame_start)
+            if use_cache:
+                self._ohlcv_cache.put_range(ticker, start_key, end_key, result, interval, cache_version)
 
         except sqlite3.DatabaseError as e:
             print(f"❌ Database error occurred: {e}")
 
         finally:
             cursor.close()
-            conn.close()
+            self._release(conn)
 
         return result
 
+    def _ohlcv_max_timestamp(self, conn):
+        """ 최신 timestamp를 기존과 같은 문자열로 반환하는 MAX(timestamp) SQL 식 """
+        if self._ohlcv_storage_is_epoch(conn):
+            return _EPOCH_MS_AS_TEXT.format(column="MAX(timestamp)")
+        return "MAX(timestamp)"
+
+    def _ohlcv_frame_from_rows(self, rows, epoch):
+        """ fetch한 행 튜플을 컬럼별 타입 배열(float64, datetime64)로 바로 변환하여 DataFrame을 만드는 메서드 """
+        columns = list(zip(*rows)) if rows else [()] * len(OHLCV_COLUMNS)
+
+        if epoch:
+            timestamps = np.array(columns[1], dtype="int64").astype("datetime64[ms]")
+        else:
+            timestamps = np.array(columns[1], dtype="datetime64[ms]")
+
+        data = {
+            "ticker": np.array(columns[0], dtype=object),
+            "timestamp": timestamps.astype("datetime64[ns]"),
+        }
+        for name, values in zip(OHLCV_COLUMNS[2:], columns[2:]):
+            data[name] = np.array(values, dtype="float64")  # NULL은 NaN으로 변환
+
+        return pd.DataFrame(data, copy=False)
+
+    @_instrumented
+    def iter_ohlcv_data(self, ticker, start_date, end_date, chunk_size=DEFAULT_CHUNK_SIZE, interval=None,
+                        with_count=False):
+        """ 특정 코인의 날짜 범위 OHLCV 데이터를 chunk_size 행씩 DataFrame으로 반환하는 제너레이터
+
+        with_count=True면 같은 읽기 트랜잭션에서 COUNT를 먼저 실행하여 첫 값으로 전체 행 수를 반환한다
+        (이어지는 chunk의 행 수 합계와 항상 같으므로 결과 배열을 미리 할당할 수 있음).
+        """
+        conn = self._connect(read=True)
+        cursor = conn.cursor()
+
+        try:
+            self._ensure_ohlcv_table_exists(conn)
+            table_name, epoch = self._ohlcv_source(conn, interval)
+            start_param = self._ohlcv_ts_param(conn, start_date, epoch)
+            end_param = self._ohlcv_ts_param(conn, end_date, epoch)
+
+            if with_count:
+                conn.execute("BEGIN")
+                cursor.execute(f'''
+                    SELECT COUNT(*) FROM {table_name} WHERE ticker = ? AND timestamp BETWEEN ? AND ?
+                ''', (ticker, start_param, end_param))
+                yield cursor.fetchone()[0]
+
+            cursor.execute(f'''
+                SELECT {self._ohlcv_select_columns(conn, raw=True, epoch=epoch)} FROM {table_name}
+                WHERE ticker = ? AND timestamp BETWEEN ? AND ?
+                ORDER BY timestamp
+            ''', (ticker, start_param, end_param))
+
+            # fetchall 대신 fetchmany로 chunk 단위로만 메모리에 올림
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                self._count_rows_read(len(rows))
+                frame_start = time.perf_counter()
+                chunk = self._ohlcv_frame_from_rows(rows, epoch)
+                self._observe_phase("frame", frame_start)
+                yield chunk
+
+        except sqlite3.DatabaseError as e:
+            print(f"❌ Database error occurred: {e}")
+
+        finally:
+            cursor.close()
+            self._release(conn)
+
+    @_instrumented
     def get_latest_ohlcv_timestamp(self, ticker):
         """ 특정 코인의 가장 최신 OHLCV 데이터 timestamp 반환 """
-        conn = self._connect()
+        cache_version = None
+        if self._ohlcv_cache is not None:
+            cached = self._ohlcv_cache.get_latest(ticker)
+            if cached is not _MISSING:
+                return cached
+            cache_version = self._ohlcv_cache.version()
+
+        conn = self._connect(read=True)
         cursor = conn.cursor()
         last_timestamp = None
 
         try:
             self._ensure_ohlcv_table_exists(conn)
             cursor.execute(f'''
-                SELECT MAX(timestamp) FROM {TableType.OHLCV.value} WHERE ticker = ?
+                SELECT {self._ohlcv_max_timestamp(conn)} FROM {TableType.OHLCV.value} WHERE ticker = ?
             ''', (ticker,))
             last_timestamp = cursor.fetchone()[0]
+            self._count_rows_read(1)
+            if self._ohlcv_cache is not None:
+                self._ohlcv_cache.put_latest(ticker, last_timestamp, cache_version)
 
         except sqlite3.DatabaseError as e:
             print(f"❌ Database error occurred: {e}")
 
         finally:
             cursor.close()
-            conn.close()
+            self._release(conn)
 
         return last_timestamp
     
-    def delete_old_ohlcv_data(self, years=2):
-        """ 현재 UTC 시간 기준으로 2년 이상된 OHLCV 데이터를 삭제하는 메서드 """
+    @_instrumented
+    def get_ohlcv_data_many(self, tickers, start_date, end_date, multi_index=False, interval=None, as_frame=True):
+        """ 여러 코인의 날짜 범위 OHLCV 데이터를 하나의 long-format DataFrame으로 조회하는 메서드
+
+        as_frame=False면 (ticker, timestamp) 순으로 정렬된 행 튜플 리스트를 반환한다 (multi_index는 무시).
+        """
+        conn = self._connect(read=True)
+        cursor = conn.cursor()
+        tickers = list(tickers)
+        rows = []
+
+        try:
+            self._ensure_ohlcv_table_exists(conn)
+            table_name, epoch = self._ohlcv_source(conn, interval)
+            start_param = self._ohlcv_ts_param(conn, start_date, epoch)
+            end_param = self._ohlcv_ts_param(conn, end_date, epoch)
+            select_columns = self._ohlcv_select_columns(conn, epoch=epoch)
+
+            for start in range(0, len(tickers), MAX_IN_PARAMS):
+                chunk = tickers[start:start + MAX_IN_PARAMS]
+                placeholders = ", ".join("?" * len(chunk))
+                cursor.execute(f'''
+                    SELECT {select_columns} FROM {table_name}
+                    WHERE ticker IN ({placeholders}) AND timestamp BETWEEN ? AND ?
+                    ORDER BY ticker, timestamp
+                ''', (*chunk, start_param, end_param))
+                rows.extend(cursor.fetchall())
+            self._count_rows_read(len(rows))
+
+        except sqlite3.DatabaseError as e:
+            print(f"❌ Database error occurred: {e}")
+
+        finally:
+            cursor.close()
+            self._release(conn)
+
+        if not as_frame:
+            return rows
+        frame_start = time.perf_counter()
+        result = pd.DataFrame(rows, columns=OHLCV_COLUMNS)
+        if multi_index:
+            result = result.set_index(["ticker", "timestamp"])
+        self._observe_phase("frame", frame_start)
+        return result
+
+    @_instrumented
+    def get_latest_ohlcv_timestamps(self, tickers=None):
+        """ 여러 코인의 가장 최신 OHLCV timestamp를 {ticker: timestamp}로 반환 (GROUP BY ticker 한 번) """
+        cached = {}
+        cache_version = self._ohlcv_cache.version() if self._ohlcv_cache is not None else None
+        if tickers is not None:
+            tickers = list(tickers)
+            if self._ohlcv_cache is not None:
+                # 캐시에 있는 티커는 제외하고 나머지만 조회
+                for ticker in tickers:
+                    value = self._ohlcv_cache.get_latest(ticker)
+                    if value is not _MISSING:
+                        cached[ticker] = value
+                if len(cached) == len(tickers):
+                    return {ticker: cached[ticker] for ticker in tickers}
+
+        conn = self._connect(read=True)
+        cursor = conn.cursor()
+        latest = {}
+
+        try:
+            self._ensure_ohlcv_table_exists(conn)
+            max_timestamp = self._ohlcv_max_timestamp(conn)
+
+            if tickers is None:
+                # 전체 티커 조회
+                cursor.execute(f'''
+                    SELECT ticker, {max_timestamp} FROM {TableType.OHLCV.value} GROUP BY ticker
+                ''')
+                rows = cursor.fetchall()
+                self._count_rows_read(len(rows))
+                latest.update(rows)
+            else:
+                # 데이터가 없는 티커는 get_latest_ohlcv_timestamp와 같이 None
+                missing = [ticker for ticker in tickers if ticker not in cached]
+                latest = dict.fromkeys(missing)
+                for start in range(0, len(missing), MAX_IN_PARAMS):
+                    chunk = missing[start:start + MAX_IN_PARAMS]
+                    placeholders = ", ".join("?" * len(chunk))
+                    cursor.execute(f'''
+                        SELECT ticker, {max_timestamp} FROM {TableType.OHLCV.value}
+                        WHERE ticker IN ({placeholders})
+                        GROUP BY ticker
+                    ''', chunk)
+                    rows = cursor.fetchall()
+                    self._count_rows_read(len(rows))
+                    latest.update(rows)
+
+            if self._ohlcv_cache is not None:
+                for ticker, value in latest.items():
+                    self._ohlcv_cache.put_latest(ticker, value, cache_version)
+
+        except sqlite3.DatabaseError as e:
+            print(f"❌ Database error occurred: {e}")
+
+        finally:
+            cursor.close()
+            self._release(conn)
+
+        if tickers is not None:
+            latest.update(cached)
+            return {ticker: latest.get(ticker) for ticker in tickers}
+        return latest
+
+    @_instrumented
+    def delete_old_ohlcv_data(self, years=2, batch_size=None):
+        """ 현재 UTC 시간 기준으로 2년 이상된 OHLCV 데이터를 삭제하는 메서드 (batch_size를 주면 배치 단위로 나눠 삭제) """
+        if batch_size is not None:
+            return self.purge_old_data(ohlcv_years=years, common_days=None, batch_size=batch_size, vacuum=False)
+
         conn = self._connect()
         cursor = conn.cursor()
 
         try:
             # 2년 전의 UTC 시간 계산
-            cutoff_date = (datetime.datetime.utcnow() - datetime.timedelta(days=years * 365)).strftime("%Y-%m-%d %H:%M:%S")
+            cutoff = datetime.datetime.utcnow() - datetime.timedelta(days=years * 365)
+            cutoff_date = cutoff.strftime("%Y-%m-%d %H:%M:%S")
 
             cursor.execute(f'''
                 DELETE FROM {TableType.OHLCV.value} WHERE timestamp < ?
-            ''', (cutoff_date,))
+            ''', (self._ohlcv_ts_param(conn, cutoff),))
             deleted_count = cursor.rowcount
+            for interval in self._active_rollups(conn):
+                cursor.execute(f"DELETE FROM {self._rollup_table_name(interval)} WHERE timestamp < ?",
+                               (_to_epoch_ms(cutoff),))
             conn.commit()
+            self._invalidate_ohlcv_cache()
             print(f"🗑️ Deleted {deleted_count} old OHLCV records older than {years} years (before {cutoff_date} UTC).")
 
         except sqlite3.DatabaseError as e:
@@ -425,7 +2039,450 @@ class SimpleData:
 
         finally:
             cursor.close()
-            conn.close()
+            self._release(conn)
+
+    def _page_stats(self, conn):
+        """ (전체 페이지 수, 빈 페이지 수, 페이지 크기) 반환 """
+        return tuple(conn.execute(f"PRAGMA {name}").fetchone()[0]
+                     for name in ("page_count", "freelist_count", "page_size"))
+
+    def _distinct_tickers(self, conn, table_name):
+        """ PK 앞부분(ticker)으로 다음 티커를 하나씩 찾아 전체 스캔 없이 티커 목록 반환 """
+        tickers = []
+        ticker = conn.execute(f"SELECT MIN(ticker) FROM {table_name}").fetchone()[0]
+        while ticker is not None:
+            tickers.append(ticker)
+            ticker = conn.execute(f"SELECT MIN(ticker) FROM {table_name} WHERE ticker > ?",
+                                  (ticker,)).fetchone()[0]
+        return tickers
+
+    def _delete_in_batches(self, conn, sql, params, batch_size, pause, stop_event):
+        """ sql(LIMIT ? 포함)을 삭제 행이 batch_size보다 적어질 때까지 반복 (배치마다 커밋하고 잠금 양보) """
+        deleted_count = 0
+
+        while stop_event is None or not stop_event.is_set():
+            self._begin_immediate(conn)
+            cursor = conn.execute(sql, (*params, batch_size))
+            batch_count = cursor.rowcount
+            conn.commit()
+            deleted_count += batch_count
+
+            if batch_count < batch_size:
+                break
+            # 배치 사이에 잠금을 풀어 insert_ohlcv_data 등 다른 writer가 들어올 수 있게 함
+            time.sleep(pause)
+
+        return deleted_count
+
+    def _incremental_vacuum(self, conn, pages_per_step, pause, stop_event):
+        """ auto_vacuum=INCREMENTAL인 경우 빈 페이지를 조금씩 파일 시스템에 반환 """
+        if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+            return False
+
+        while stop_event is None or not stop_event.is_set():
+            if conn.execute("PRAGMA freelist_count").fetchone()[0] == 0:
+                break
+            conn.execute(f"PRAGMA incremental_vacuum({int(pages_per_step)})").fetchall()
+            time.sleep(pause)
+        return True
+
+    @_instrumented
+    def purge_old_data(self, ohlcv_years=2, common_days=None, batch_size=5000, pause=0.05,
+                       vacuum=True, vacuum_pages=1000, stop_event=None):
+        """ 보관기간이 지난 OHLCV / common_data를 batch_size 단위 트랜잭션으로 나눠 삭제하는 메서드
+
+        ohlcv_years / common_days가 None이면 해당 테이블은 건너뛴다. 배치 사이에 pause초 동안 쓰기 잠금을
+        놓아 수집(ingest)이 타임아웃되지 않게 하고, vacuum=True이면 auto_vacuum=INCREMENTAL DB에서
+        빈 페이지를 회수한다. 삭제 행 수와 해제/회수된 바이트를 dict로 반환한다.
+        """
+        conn = self._connect()
+        report = {"ohlcv_rows": 0, "common_rows": 0, "bytes_freed": 0, "bytes_reclaimed": 0}
+
+        try:
+            page_count, freelist_count, page_size = self._page_stats(conn)
+
+            if ohlcv_years is not None:
+                self._ensure_ohlcv_table_exists(conn)
+                cutoff = datetime.datetime.utcnow() - datetime.timedelta(days=ohlcv_years * 365)
+                tables = [(TableType.OHLCV.value, self._ohlcv_ts_param(conn, cutoff))]
+                tables += [(self._rollup_table_name(interval), _to_epoch_ms(cutoff))
+                           for interval in self._active_rollups(conn)]
+
+                tickers = self._distinct_tickers(conn, TableType.OHLCV.value)
+                for table_name, cutoff_param in tables:
+                    for ticker in tickers:
+                        # (ticker, timestamp) PK 범위 검색으로 티커별 오래된 행부터 삭제
+                        deleted_count = self._delete_in_batches(conn, f'''
+                            DELETE FROM {table_name}
+                            WHERE ticker = ? AND timestamp IN (
+                                SELECT timestamp FROM {table_name}
+                                WHERE ticker = ? AND timestamp < ?
+                                ORDER BY timestamp
+                                LIMIT ?
+                            )
+                        ''', (ticker, ticker, cutoff_param), batch_size, pause, stop_event)
+                        if table_name == TableType.OHLCV.value:
+                            report["ohlcv_rows"] += deleted_count
+                self._invalidate_ohlcv_cache()
+
+            if common_days is not None:
+                self._ensure_table_exists(conn)
+                now = datetime.datetime.now(datetime.timezone.utc)
+                cutoff_date = (now - datetime.timedelta(days=common_days)).strftime("%Y-%m-%d %H:%M:%S")
+                report["common_rows"] = self._delete_in_batches(conn, '''
+                    DELETE FROM common_data
+                    WHERE id IN (SELECT id FROM common_data WHERE date < ? LIMIT ?)
+                ''', (cutoff_date,), batch_size, pause, stop_event)
+
+            _, freed_freelist, _ = self._page_stats(conn)
+            if vacuum and not self._incremental_vacuum(conn, vacuum_pages, pause, stop_event):
+                print("ℹ️ auto_vacuum is not INCREMENTAL; call enable_incremental_vacuum() to reclaim freed pages.")
+
+            new_page_count, new_freelist_count, _ = self._page_stats(conn)
+            report["bytes_reclaimed"] = (page_count - new_page_count) * page_size
+            report["bytes_freed"] = max(freed_freelist - freelist_count, 0) * page_size
+            print(f"🗑️ Retention: deleted {report['ohlcv_rows']} OHLCV / {report['common_rows']} common_data "
+                  f"record(s), freed {report['bytes_freed']} bytes, reclaimed {report['bytes_reclaimed']} bytes.")
+
+        except sqlite3.DatabaseError as e:
+            print(f"❌ Database error occurred: {e}")
+            if conn.in_transaction:
+                conn.rollback()
+
+        finally:
+            self._release(conn)
+
+        return report
+
+    def enable_incremental_vacuum(self):
+        """ 기존 DB를 auto_vacuum=INCREMENTAL로 전환하는 메서드 (전체 VACUUM 1회 수행) """
+        conn = self._connect()
+
+        try:
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            conn.execute("VACUUM")
+            print("✅ auto_vacuum set to INCREMENTAL.")
+
+        except sqlite3.DatabaseError as e:
+            print(f"❌ Database error occurred: {e}")
+
+        finally:
+            self._release(conn)
+
+    def start_retention(self, interval=3600.0, **purge_options):
+        """ interval초마다 purge_old_data(**purge_options)를 백그라운드에서 실행 """
+        if self._retention is None:
+            self._retention = RetentionWorker(self, interval=interval, **purge_options)
+        return self._retention
+
+    def stop_retention(self):
+        """ 백그라운드 보관기간 정리 중지 """
+        if self._retention is not None:
+            self._retention.stop()
+            self._retention = None
+
+    def enable_replica(self, replica_path=None, max_lag=5.0, pages=REPLICA_BACKUP_PAGES):
+        """ 온라인 backup API로 읽기 전용 사본을 만들고 조회 메서드를 사본으로 보내도록 설정
+
+        사본은 max_lag / 2초마다 새로 만들어 원자적으로 교체하므로 조회 결과는 최대 max_lag초 전 데이터이다.
+        원본이 바뀌지 않았으면(data_version) 복사하지 않는다. 갱신이 밀려 사본이 max_lag보다 오래되면 조회는
+        원본 DB로 돌아간다. 쓰기는 항상 원본에서 수행한다.
+        pages는 backup 한 단계에서 복사할 페이지 수 (-1이면 한 번에 전부 복사).
+
+        원본은 WAL 모드(pooled=True)를 전제로 한다. rollback journal 모드에서는 backup 단계마다 SHARED 잠금을
+        잡으므로 그동안 writer가 커밋하지 못하고, 복사 중 커밋이 끼어들면 backup이 처음부터 다시 시작된다.
+        """
+        if self.read_only:
+            raise ValueError("enable_replica needs a writable primary database")
+        if self._replica is not None:
+            return self._replica
+
+        # 사본에는 테이블을 만들 수 없으므로 원본 스키마를 먼저 확정
+        conn = self._connect()
+        try:
+            self._create_schema(conn)
+            conn.commit()
+        finally:
+            self._release(conn)
+
+        self._replica_path = replica_path or f"{self.db_path}.replica"
+        self._replica_max_lag = max_lag
+        self._replica_pages = pages
+        if self._ohlcv_cache is not None:
+            # 사본에서 읽어 캐시에 넣은 값도 max_lag보다 오래 남지 않도록 TTL 제한
+            self._ohlcv_cache.max_ttl = max_lag
+        self.refresh_replica()
+        self._replica = ReplicaRefresher(self, interval=max_lag / 2)
+        return self._replica
+
+    @_instrumented
+    def refresh_replica(self):
+        """ 원본 DB를 임시 파일로 backup한 뒤 사본 파일과 원자적으로 교체하는 메서드 (교체 성공 여부 반환) """
+        with self._replica_refresh_lock:
+            replica_path = self._replica_path
+            if replica_path is None:
+                return False
+
+            tmp_path = f"{replica_path}.tmp"
+            snapshot_at = time.monotonic()
+            target = None
+            try:
+                # data_version은 같은 연결에서 다시 읽었을 때 다른 연결(프로세스)의 커밋이 있었으면 바뀜
+                if self._replica_source is None:
+                    self._replica_source = _connect_sqlite(self.db_path, 10, check_same_thread=False)
+                source = self._replica_source
+                data_version = source.execute("PRAGMA data_version").fetchone()[0]
+                if data_version == self._replica_data_version and os.path.exists(replica_path):
+                    # 원본이 바뀌지 않았으면 복사하지 않고 사본 시각만 갱신
+                    self._replica_refreshed_at = snapshot_at
+                    return True
+
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                target = sqlite3.connect(tmp_path)
+                # WAL 모드에서는 backup의 읽기 트랜잭션이 writer를 막지 않음
+                source.backup(target, pages=self._replica_pages, progress=self._backup_progress())
+                # 사본은 mode=ro로 열기 때문에 -wal / -shm 파일이 필요 없는 rollback journal 모드로 저장
+                target.execute("PRAGMA journal_mode=DELETE")
+                target.close()
+                target = None
+                with self._replica_swap_lock:
+                    os.replace(tmp_path, replica_path)
+                    self._replica_generation += 1
+                self._replica_data_version = data_version
+
+            except (sqlite3.DatabaseError, OSError, _BackupRestarted) as e:
+                print(f"❌ Replica refresh failed: {e}")
+                return False
+
+            finally:
+                if target is not None:
+                    target.close()
+
+            # 이미 열린 사본 연결은 교체 전 파일(inode)을 계속 읽고, 새 연결부터 새 사본을 읽음
+            self._replica_refreshed_at = snapshot_at
+            # 이전 사본에서 읽어 캐시에 넣은 값은 쓰기 무효화 이후의 오래된 값일 수 있으므로 비움
+            self._invalidate_ohlcv_cache()
+            return True
+
+    @staticmethod
+    def _backup_progress():
+        """ backup 진행 콜백: 원본 변경으로 처음부터 다시 시작된 횟수가 REPLICA_BACKUP_RESTARTS를 넘으면 중단 """
+        state = {"remaining": None, "restarts": 0}
+
+        def progress(status, remaining, total):
+            if state["remaining"] is not None and remaining > state["remaining"]:
+                state["restarts"] += 1
+                if state["restarts"] > REPLICA_BACKUP_RESTARTS:
+                    raise _BackupRestarted(f"backup restarted {state['restarts']} times by concurrent writes")
+            state["remaining"] = remaining
+        return progress
+
+    def replica_lag(self):
+        """ 사본이 원본보다 뒤처진 최대 시간(초) 반환 (사본을 쓰지 않으면 None) """
+        if self._replica_refreshed_at is None:
+            return None
+        return time.monotonic() - self._replica_refreshed_at
+
+    def disable_replica(self):
+        """ 사본 갱신을 멈추고 조회를 다시 원본 DB로 보내는 메서드 (사본 파일은 남겨둠) """
+        if self._replica is not None:
+            self._replica.stop()
+            self._replica = None
+        with self._replica_refresh_lock:
+            self._replica_path = None
+            self._replica_refreshed_at = None
+            self._replica_data_version = None
+            if self._replica_source is not None:
+                self._replica_source.close()
+                self._replica_source = None
+        if self._ohlcv_cache is not None:
+            self._ohlcv_cache.max_ttl = None
+
+    @_instrumented
+    def export_ohlcv_snapshot(self, directory, tickers=None, interval=None, chunk_size=DEFAULT_CHUNK_SIZE):
+        """ OHLCV 데이터를 티커별 컬럼 .npy 파일(메모리 매핑 가능)로 내보내는 메서드
+
+        timestamp는 datetime64[ns], 가격/거래량은 float64로 저장하며 chunk 단위로 파일에 직접 써서
+        메모리 사용량이 티커 전체 크기에 비례하지 않는다. load_ohlcv_snapshot으로 읽는다.
+        이미 스냅샷이 있는 디렉터리에 내보내면 manifest에 티커를 병합한다 (다른 테이블/간격의 스냅샷이면 ValueError).
+        """
+        conn = self._connect(read=True)
+        cursor = conn.cursor()
+        exported = {}
+
+        try:
+            self._ensure_ohlcv_table_exists(conn)
+            table_name, epoch = self._ohlcv_source(conn, interval)
+            select_columns = self._ohlcv_select_columns(conn, raw=True, epoch=epoch)
+
+            # 기존 스냅샷 디렉터리에 일부 티커만 다시 내보내면 manifest에 병합 (같은 테이블/간격일 때만 허용)
+            previous = {}
+            if os.path.exists(os.path.join(directory, SNAPSHOT_MANIFEST)):
+                manifest = load_ohlcv_snapshot_manifest(directory)
+                if (manifest.get("table"), manifest.get("interval")) != (table_name, interval):
+                    raise ValueError(f"{directory} already holds a snapshot of {manifest.get('table')} "
+                                     f"(interval={manifest.get('interval')}); export into an empty directory")
+                previous = manifest.get("tickers", {})
+
+            if tickers is None:
+                cursor.execute(f"SELECT DISTINCT ticker FROM {table_name}")
+                tickers = [row[0] for row in cursor.fetchall()]
+
+            for ticker in tickers:
+                ticker_dir = _snapshot_ticker_dir(directory, ticker)
+                os.makedirs(ticker_dir, exist_ok=True)
+                files = {}
+                try:
+                    # COUNT와 SELECT가 같은 스냅샷을 보도록 한 읽기 트랜잭션에서 실행 (동시 쓰기로 행 수가 달라지지 않음)
+                    conn.execute("BEGIN")
+                    cursor.execute(f"SELECT COUNT(*) FROM {table_name} WHERE ticker = ?", (ticker,))
+                    row_count = cursor.fetchone()[0]
+
+                    # 컬럼별 .npy 파일을 미리 할당한 뒤 chunk를 순서대로 채움 (임시 파일에 쓰고 교체)
+                    for name in OHLCV_COLUMNS[1:]:
+                        dtype = "datetime64[ns]" if name == "timestamp" else "float64"
+                        files[name] = np.lib.format.open_memmap(
+                            os.path.join(ticker_dir, f"{name}.npy.tmp"), mode="w+", dtype=dtype, shape=(row_count,))
+
+                    cursor.execute(f'''
+                        SELECT {select_columns} FROM {table_name} WHERE ticker = ? ORDER BY timestamp
+                    ''', (ticker,))
+                    offset = 0
+                    while True:
+                        rows = cursor.fetchmany(chunk_size)
+                        if not rows:
+                            break
+                        self._count_rows_read(len(rows))
+                        chunk = self._ohlcv_frame_from_rows(rows, epoch)
+                        end = offset + len(chunk)
+                        for name, array in files.items():
+                            array[offset:end] = chunk[name].to_numpy()
+                        offset = end
+                    conn.rollback()  # 읽기 트랜잭션 종료
+
+                    for name, array in files.items():
+                        array.flush()
+                        os.replace(os.path.join(ticker_dir, f"{name}.npy.tmp"),
+                                   os.path.join(ticker_dir, f"{name}.npy"))
+
+                except BaseException:
+                    # 실패한 티커의 임시 파일은 남기지 않음
+                    files.clear()
+                    for name in OHLCV_COLUMNS[1:]:
+                        tmp_path = os.path.join(ticker_dir, f"{name}.npy.tmp")
+                        if os.path.exists(tmp_path):
+                            os.remove(tmp_path)
+                    raise
+
+                files.clear()
+                exported_at = datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+                exported[ticker] = {"rows": offset, "exported_at": exported_at}
+
+            manifest = {
+                "table": table_name,
+                "interval": interval,
+                "columns": OHLCV_COLUMNS[1:],
+                "exported_at": datetime.datetime.now(datetime.timezone.utc).strftime("%Y-%m-%d %H:%M:%S"),
+                "tickers": {**previous, **exported},
+            }
+            # 임시 파일에 쓴 뒤 교체하여 읽는 쪽이 반쯤 쓴 manifest를 보지 않게 함
+            manifest_path = os.path.join(directory, SNAPSHOT_MANIFEST)
+            with open(f"{manifest_path}.tmp", "w", encoding="utf-8") as f:
+                json.dump(manifest, f, ensure_ascii=False, indent=2)
+            os.replace(f"{manifest_path}.tmp", manifest_path)
+            print(f"✅ Exported OHLCV snapshot of {len(exported)} ticker(s) to {directory}")
+
+        except sqlite3.DatabaseError as e:
+            print(f"❌ Database error occurred: {e}")
+
+        finally:
+            cursor.close()
+            self._release(conn)
+
+        return exported
+
+    def migrate_ohlcv_to_epoch(self, vacuum=True):
+        """ 기존 TEXT timestamp OHLCV 테이블을 epoch 밀리초 WITHOUT ROWID 테이블로 변환하는 1회성 마이그레이션
+
+        실행 중인 다른 인스턴스/프로세스는 schema_version 변경으로 새 형식을 감지하고 다음 쓰기부터 epoch로 저장한다.
+        그 외 외부 도구로 OHLCV 테이블에 직접 쓰는 writer는 마이그레이션 동안 멈춰야 한다.
+        """
+        conn = self._connect()
+        cursor = conn.cursor()
+        table_name = TableType.OHLCV.value
+        migrated_count = 0
+
+        try:
+            self._begin_immediate(conn)
+
+            # 이미 새 형식이면 건너뜀
+            self._ohlcv_epoch = None
+            if self._ohlcv_storage_is_epoch(conn):
+                conn.rollback()
+                print(f"ℹ️ {table_name} is already stored as epoch milliseconds.")
+                return migrated_count
+
+            # 새 테이블에 변환하여 복사한 뒤 교체 (한 트랜잭션)
+            self._create_ohlcv_table(conn, f"{table_name}_epoch")
+            cursor.execute(f'''
+                INSERT OR REPLACE INTO {table_name}_epoch
+                (ticker, timestamp, open, high, low, close, volume, value, price_change)
+                SELECT ticker, {_TEXT_AS_EPOCH_MS.format(column="timestamp")},
+                       open, high, low, close, volume, value, price_change
+                FROM {table_name}
+            ''')
+            migrated_count = cursor.rowcount
+            cursor.execute(f"DROP TABLE {table_name}")
+            cursor.execute(f"ALTER TABLE {table_name}_epoch RENAME TO {table_name}")
+            conn.commit()
+            self._ohlcv_epoch = None  # 다음 호출에서 새 schema_version으로 다시 확인
+            print(f"✅ Migrated {migrated_count} OHLCV records to epoch millisecond timestamps.")
+            self.refresh_replica()
+
+            # 기존 테이블이 쓰던 페이지 회수
+            if vacuum:
+                conn.execute('VACUUM')
+
+        except sqlite3.DatabaseError as e:
+            print(f"❌ Database error occurred: {e}")
+            conn.rollback()
+            self._ohlcv_epoch = None
+
+        finally:
+            cursor.close()
+            self._release(conn)
+
+        return migrated_count
+
+def _snapshot_ticker_dir(directory, ticker):
+    """ 스냅샷 안에서 티커별 컬럼 파일을 두는 디렉터리 경로 """
+    return os.path.join(directory, ticker.replace(os.sep, "_"))
+
+def load_ohlcv_snapshot_manifest(directory):
+    """ export_ohlcv_snapshot이 기록한 manifest.json (티커별 행 수 등) 반환 """
+    with open(os.path.join(directory, SNAPSHOT_MANIFEST), encoding="utf-8") as f:
+        return json.load(f)
+
+def load_ohlcv_snapshot(directory, ticker, as_frame=False):
+    """ 스냅샷의 티커 컬럼들을 복사 없이 메모리 매핑하여 {컬럼: 읽기 전용 배열}로 반환
+
+    여러 프로세스가 같은 파일을 매핑하면 OS 페이지 캐시의 한 사본을 공유한다.
+    as_frame=True면 DataFrame으로 만들어 반환한다 (이때는 pandas가 데이터를 복사한다).
+    """
+    ticker_dir = _snapshot_ticker_dir(directory, ticker)
+    # manifest의 행 수만큼만 사용 (그 뒤는 내보낸 행이 아님)
+    row_count = load_ohlcv_snapshot_manifest(directory)["tickers"][ticker]["rows"]
+    columns = {
+        name: np.load(os.path.join(ticker_dir, f"{name}.npy"), mmap_mode="r")[:row_count]
+        for name in OHLCV_COLUMNS[1:]
+    }
+    if not as_frame:
+        return columns
+
+    df = pd.DataFrame(columns)
+    df.insert(0, "ticker", ticker)
+    return df
 
 # 사용 예제
 if __name__ == "__main__":